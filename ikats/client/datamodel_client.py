@@ -377,7 +377,7 @@ class DatamodelClient(GenericClient):
         :raises TypeError: if *tsuid* not a str
         :raises TypeError: if *name* not a str
         :raises TypeError: if *value* not a str or a number
-        :raises TypeError: if *data_type* not a DTYPE
+        :raises TypeError: if *data_type* not a MDType
         :raises TypeError: if *force_update* not a bool
 
         :raises ValueError: if *tsuid* is empty
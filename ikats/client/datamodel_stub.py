@@ -16,20 +16,9 @@ limitations under the License.
 
 """
 
-from enum import Enum
-
 from ikats.client import DatamodelClient
 from ikats.exceptions import IkatsConflictError, IkatsNotFoundError
-
-
-class DTYPE(Enum):
-    """
-    Enum used for Data types of Metadata
-    """
-    string = "string"
-    date = "date"
-    number = "number"
-    complex = "complex"
+from ikats.lib import MDType
 
 
 class Singleton(type):
@@ -108,24 +97,26 @@ class DatamodelStub(DatamodelClient, metaclass=Singleton):
         temp = [x for x in self.db_ts if x['tsuid'] != tsuid]
         self.db_ts = temp
 
-    def metadata_create(self, tsuid, name, value, data_type=DTYPE.string, force_update=False):
-        self.db_md[tsuid] = {'name': name, 'value': value, "data_type": data_type}
+    def metadata_create(self, tsuid, name, value, data_type=MDType.STRING, force_update=False):
+        md_list = [x for x in self.db_md.get(tsuid, []) if x["name"] != name]
+        self.db_md[tsuid] = md_list + [{'name': name, 'value': value, "data_type": data_type}]
+        return True
 
-    def metadata_update(self, tsuid, name, value, data_type=DTYPE.string, force_create=False):
-        self.db_md[tsuid] = {'name': name, 'value': value, "data_type": data_type}
+    def metadata_update(self, tsuid, name, value, data_type=MDType.STRING, force_create=False):
+        return self.metadata_create(tsuid=tsuid, name=name, value=value, data_type=data_type)
 
     def metadata_delete(self, tsuid, name, raise_exception=True):
-        md_list = self.db_md[tsuid]
+        md_list = self.db_md.get(tsuid, [])
         self.db_md[tsuid] = [x for x in md_list if x["name"] != name]
+        return True
 
     def metadata_get(self, ts_list):
         return [self.db_md[x] for x in ts_list]
 
     def metadata_get_typed(self, ts_list):
-        try:
-            return [self.db_md[x] for x in ts_list]
-        except KeyError:
-            raise IkatsNotFoundError()
+        return {tsuid: {x["name"]: {"value": x["value"], "dtype": MDType(x["data_type"])}
+                        for x in self.db_md.get(tsuid, [])}
+                for tsuid in ts_list}
 
     def get_ts_from_metadata(self, constraint=None):
         raise NotImplementedError()
@@ -140,7 +131,11 @@ class DatamodelStub(DatamodelClient, metaclass=Singleton):
             raise IkatsNotFoundError()
 
     def search_functional_identifiers(self, criterion_type, criteria_list):
-        raise NotImplementedError()
+        key = {"tsuids": "tsuid", "funcIds": "funcId"}[criterion_type]
+        result = [x for x in self.db_ts if x[key] in criteria_list]
+        if not result:
+            raise IkatsNotFoundError()
+        return result
 
     def table_create(self, data):
         self.db_table.append(data)
@@ -24,6 +24,12 @@ from ikats.exceptions import (IkatsClientError, IkatsConflictError,
 from ikats.lib import check_type
 from ikats.objects.session_ import IkatsSession
 
+try:
+    # Faster json decoder, used when available
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def close_files(json):
     """
@@ -142,8 +148,8 @@ class RestClientResponse:
         """
         The json getter: also available from self.json property.
 
-        Note that there is a lazy computing of self.__json value, calling self.__result.json()
-        made only once.
+        Note that there is a lazy computing of self.__json value, decoding the body only once
+        (using orjson when available, self.__result.json() otherwise).
 
         :returns: the effective json content deduced from self.__result. In case of error/empty body,
           RestClientResponse.DEFAULT_JSON_INIT is returned.
@@ -152,12 +158,29 @@ class RestClientResponse:
             # default value backward-compatible with previous interface
             self.__json = RestClientResponse.DEFAULT_JSON_INIT
             try:
-                self.__json = self.__result.json()
+                self.__json = self.__loads()
             except ValueError:
                 # If the content is not json formatted, let the empty json fills the json field
                 pass
         return self.__json
 
+    def __loads(self):
+        """
+        Decode the json body
+
+        :returns: the decoded body
+        :rtype: object
+
+        :raises ValueError: if the body is not json formatted
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(self.content)
+            except ValueError:
+                # orjson is stricter than the standard decoder (eg. NaN), let the latter decide
+                pass
+        return self.__result.json()
+
     def __str__(self):
         msg = "{} {}"
         return msg.format(self.status_code, self.url)
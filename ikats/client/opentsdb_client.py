@@ -36,6 +36,20 @@ TEMPLATES = {
 }
 
 
+def points_summary(data):
+    """
+    Compute the basic information about points, as stored in metadata
+
+    :param data: points as array (1st column is the timestamp, 2nd is the value)
+    :type data: np.array or list
+
+    :returns: the start_date, end_date (timestamps of the oldest and newest points), nb_points
+    :rtype: tuple
+    """
+    timestamps = np.asarray(data, dtype=np.float64).reshape(-1, 2)[:, 0]
+    return int(timestamps.min()), int(timestamps.max()), len(timestamps)
+
+
 class OpenTSDBClient(GenericClient):
     """
     Wrapper for Ikats to connect to OpenTSDB api
@@ -272,9 +286,9 @@ class OpenTSDBClient(GenericClient):
         :type ed: int
 
         :returns: the data associated to the tsuid
-            Numpy array is a 2D array where:
-                * Column 1 represents the timestamp as numpy.int64 format
-                * Column 2 represents the value associated to this timestamp as numpy.float64
+            Numpy array is a (N,2) float64 array where:
+                * Column 1 represents the timestamp (ms since EPOCH)
+                * Column 2 represents the value associated to this timestamp
 
         :rtype: numpy array
 
@@ -336,16 +350,20 @@ class OpenTSDBClient(GenericClient):
                     time.sleep(4)
                     continue
 
-                # Converts to numpy Arrays
+                # Converts to numpy Arrays (one column at a time, without building intermediate points)
                 dps = response.json[0]['dps']
-                array = np.array([[int(k), float(v)] for k, v in dps.items()], dtype=object)
+                timestamps = np.fromiter(map(int, dps.keys()), dtype=np.float64, count=len(dps))
+                values = np.fromiter(dps.values(), dtype=np.float64, count=len(dps))
 
                 # Sort array by date
                 # The conversion JSON to python dict was performed automatically
                 # Because the python dict is not ordered by key, the sort operation is mandatory
-                array = array[array[:, 0].argsort()]
+                order = timestamps.argsort()
+                array = np.empty((len(dps), 2))
+                array[:, 0] = timestamps[order]
+                array[:, 1] = values[order]
             except IndexError:
-                array = np.array([])
+                array = np.empty((0, 2))
             except KeyError:
                 raise ValueError(response.json)
             return array
@@ -355,10 +373,10 @@ class OpenTSDBClient(GenericClient):
         """
 
         :param tsuid: TSUID to use
-        :param data: points as array
+        :param data: points as array (1st column is the timestamp, 2nd is the value)
 
         :type tsuid: str
-        :type data: list
+        :type data: np.array or list
 
         :returns: the start_date, end_date, nb_points
         """
@@ -367,11 +385,11 @@ class OpenTSDBClient(GenericClient):
 
         # Building body with points
         json_data = []
-        for point in data:
+        for timestamp, value in data:
             json_data.append({
                 "metric": metric,
-                "timestamp": str(point[0]).zfill(13),
-                "value": point[1],
+                "timestamp": str(int(timestamp)).zfill(13),
+                "value": float(value),
                 "tags": tags
             })
 
@@ -388,4 +406,4 @@ class OpenTSDBClient(GenericClient):
         is_4xx(response, "Unexpected client error: {code}")
         is_5xx(response, "Unexpected server error: {code}")
 
-        return data[0][0], data[-1][0], len(data)
+        return points_summary(data)
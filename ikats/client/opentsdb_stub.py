@@ -18,7 +18,7 @@ limitations under the License.
 
 import random
 
-from ikats.client.opentsdb_client import OpenTSDBClient
+from ikats.client.opentsdb_client import OpenTSDBClient, points_summary
 
 
 class Singleton(type):
@@ -51,4 +51,4 @@ class OpenTSDBStub(OpenTSDBClient, metaclass=Singleton):
 
     def add_points(self, tsuid, data):
         self.DB[tsuid] = data
-        return data[0][0], data[-1][0], len(data)
+        return points_summary(data)
@@ -69,6 +69,10 @@ class TestDataset(TestCase):
         self.assertEqual(nb_points, len(data))
         self.assertEqual(period, data[1][0] - data[0][0])
 
+        # Same seed, same points
+        self.assertEqual(gen_random_ts(sd=sd, ed=ed, period=period, seed=42).tolist(),
+                         gen_random_ts(sd=sd, ed=ed, period=period, seed=42).tolist())
+
         # Mismatch between parameters
         with self.assertRaises(ValueError):
             gen_random_ts(sd=sd, ed=ed, nb_points=nb_points, period=42)
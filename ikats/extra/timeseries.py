@@ -16,10 +16,13 @@ limitations under the License.
 
 """
 
-import random
+import numpy as np
 
+# Random generator shared by the calls without seed
+_RNG = np.random.default_rng()
 
-def gen_random_ts(sd=None, ed=None, nb_points=None, period=None):
+
+def gen_random_ts(sd=None, ed=None, nb_points=None, period=None, seed=None):
     """
     Generates a random Timeseries composed of nb_points between sd and ed (start & end dates)
     end_date is excluded from the range, ie. [sd;ed[
@@ -29,14 +32,16 @@ def gen_random_ts(sd=None, ed=None, nb_points=None, period=None):
     :param ed: end date (in ms since EPOCH)
     :param nb_points: number of points
     :param period: difference between successive points (in ms)
+    :param seed: (optional) seed of the random values, to get the same points each time
 
     :type sd: int
     :type ed: int
     :type nb_points: int
     :type period: int
+    :type seed: int or None
 
-    :returns: the data points in a 2D array where 1st col is the timestamp in EPOCH (ms) and the 2nd is the value
-    :rtype: list of points
+    :returns: the data points in a (N,2) array where 1st col is the timestamp in EPOCH (ms) and the 2nd is the value
+    :rtype: np.array
     """
 
     # At least 3 out of 4 parameters shall be set in order to create the data
@@ -56,9 +61,9 @@ def gen_random_ts(sd=None, ed=None, nb_points=None, period=None):
     if period == 0 or int((ed - sd) / period) != nb_points or not ((ed - sd) / period).is_integer():
         raise ValueError("Bad inputs, can't generate Timeseries")
 
-    # generate data
-    time_col = range(sd, ed, period)
-    val_col = [random.random() * 10 - 5]
-    for _ in time_col:
-        val_col.append(random.random() * 10 - 5 + val_col[-1])
-    return list(zip(time_col, val_col))
+    # generate data: random walk with steps within [-5;5[
+    data = np.empty((nb_points, 2))
+    data[:, 0] = np.arange(sd, ed, period)
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    data[:, 1] = rng.uniform(-5, 5, nb_points).cumsum()
+    return data
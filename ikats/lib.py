@@ -15,9 +15,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
+import threading
 from enum import Enum
 
 
+# Types to compare with (None replaced by NoneType) by allowed_types of check_type
+_ALLOWED_TYPES = {}
+
+
 def check_type(value, allowed_types, var_name="variable", raise_exception=True):
     """
     Raises TypeError or returns False if value doesn't belong to the allowed types
@@ -38,19 +43,79 @@ def check_type(value, allowed_types, var_name="variable", raise_exception=True):
     :raises TypeError: if value doesn't belong to the allowed types
     """
 
-    # Convert single type to a list of one type
-    if not isinstance(allowed_types, list):
-        allowed_types = [allowed_types]
-
     value_type = type(value)
 
-    if (value is None and None in allowed_types) or (value_type in allowed_types):
+    # Single type: direct comparison
+    if type(allowed_types) is not list:
+        if value_type is allowed_types or (value is None and allowed_types is None):
+            return True
+        return _type_mismatch(value_type, [allowed_types], var_name, raise_exception)
+
+    key = tuple(allowed_types)
+    try:
+        types = _ALLOWED_TYPES[key]
+    except KeyError:
+        types = _ALLOWED_TYPES[key] = tuple(type(None) if x is None else x for x in key)
+
+    if value_type in types:
         return True
+    return _type_mismatch(value_type, allowed_types, var_name, raise_exception)
+
+
+def _type_mismatch(value_type, allowed_types, var_name, raise_exception):
+    """
+    Failure path of check_type: the error message is only built here
+
+    :returns: False (if no exception is raised)
+    :rtype: bool
+
+    :raises TypeError: if *raise_exception* is set
+    """
     if raise_exception:
-        raise TypeError("Type of %s shall belong to %s, not %s" % (var_name, allowed_types, value_type))
+        raise TypeError("Type of %s shall belong to %s, not %s" % (var_name, list(allowed_types), value_type))
     return False
 
 
+def typed_attrs(spec):
+    """
+    Class decorator replacing the setters of the properties listed in *spec* by setters checking the type of the value
+    The checks are built once per class so that setting a value costs a single type lookup
+
+    Each property keeps its getter (and its documentation) and stores the value in the member
+    ``_<property name>`` of the decorated class.
+
+    :param spec: allowed types (same meaning as check_type allowed_types) by property name
+    :type spec: dict
+
+    :returns: the class decorator
+    :rtype: function
+    """
+
+    def build_setter(storage, var_name, allowed_types):
+        """
+        Build the setter storing the value in *storage* after checking its type
+        """
+        accept_none = None in allowed_types
+        types = frozenset(x for x in allowed_types if x is not None)
+
+        def setter(self, value):
+            if type(value) not in types and not (accept_none and value is None):
+                raise TypeError("Type of %s shall belong to %s, not %s" % (var_name, allowed_types, type(value)))
+            setattr(self, storage, value)
+
+        return setter
+
+    def decorator(cls):
+        for var_name, allowed_types in spec.items():
+            if not isinstance(allowed_types, list):
+                allowed_types = [allowed_types]
+            prop = cls.__dict__[var_name]
+            setattr(cls, var_name, prop.setter(build_setter("_" + var_name, var_name, allowed_types)))
+        return cls
+
+    return decorator
+
+
 def check_is_fid_valid(fid, raise_exception=True):
     """
     Check if FID is well formed
@@ -152,3 +217,87 @@ class MDType(Enum):
     DATE = "date"
     NUMBER = "number"
     COMPLEX = "complex"
+
+
+class CountedCache:
+    """
+    Cache whose entries expire after a given number of reads
+    Bounds the staleness of cached information without any invalidation coming from the server
+    """
+
+    def __init__(self, reads, maxsize=256):
+        """
+        :param reads: number of reads served by an entry before being loaded again
+        :param maxsize: maximum number of entries kept (oldest ones are dropped first)
+
+        :type reads: int
+        :type maxsize: int
+        """
+        check_type(value=reads, allowed_types=int, var_name="reads", raise_exception=True)
+        check_type(value=maxsize, allowed_types=int, var_name="maxsize", raise_exception=True)
+        self.__reads = reads
+        self.__maxsize = maxsize
+        # key -> (value, remaining reads)
+        self.__entries = {}
+        # key -> event set once the value being loaded is available
+        self.__loading = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key, loader):
+        """
+        Get the value cached for *key*
+        *loader* is called to (re)load it when absent or expired
+        Safe to call from several threads: a key being loaded by a thread is not loaded again by the others
+
+        :param key: key of the entry
+        :param loader: function without argument returning the value to cache
+
+        :type key: hashable
+        :type loader: function
+
+        :returns: the cached value
+        :rtype: any
+        """
+        while True:
+            with self.__lock:
+                value, remaining = self.__entries.get(key, (None, 0))
+                if remaining > 0:
+                    self.__entries[key] = (value, remaining - 1)
+                    return value
+                loading = self.__loading.get(key)
+                if loading is None:
+                    loading = self.__loading[key] = threading.Event()
+                    break
+            # Another thread is loading this key, use its result
+            loading.wait()
+
+        try:
+            value = loader()
+            with self.__lock:
+                self.__entries.pop(key, None)
+                if len(self.__entries) >= self.__maxsize:
+                    # Drop the oldest entry
+                    self.__entries.pop(next(iter(self.__entries)), None)
+                self.__entries[key] = (value, self.__reads)
+            return value
+        finally:
+            with self.__lock:
+                del self.__loading[key]
+            loading.set()
+
+    def invalidate(self, match=None):
+        """
+        Drop the entries whose key satisfies *match* (all entries if not provided)
+
+        :param match: function returning True for the keys to drop
+        :type match: function
+        """
+        with self.__lock:
+            if match is None:
+                self.__entries.clear()
+            else:
+                for key in [x for x in self.__entries if match(x)]:
+                    del self.__entries[key]
+
+    def __len__(self):
+        return len(self.__entries)
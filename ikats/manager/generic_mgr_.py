@@ -15,6 +15,56 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Maximum number of concurrent requests sent to backends by the end points
+MAX_PARALLEL_REQUESTS = 8
+
+# Workers shared by all the end points to overlap their requests (created upon first use)
+_REQUESTS_POOL = None
+_REQUESTS_POOL_LOCK = threading.Lock()
+_REQUESTS_POOL_PREFIX = "ikats-requests"
+
+
+def _requests_pool():
+    """
+    Get the workers shared by the end points, created upon first call
+
+    :rtype: ThreadPoolExecutor
+    """
+    global _REQUESTS_POOL
+    with _REQUESTS_POOL_LOCK:
+        if _REQUESTS_POOL is None:
+            _REQUESTS_POOL = ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS,
+                                                thread_name_prefix=_REQUESTS_POOL_PREFIX)
+        return _REQUESTS_POOL
+
+
+def run_concurrently(action, kwargs_list):
+    """
+    Run *action* once per element of *kwargs_list*, overlapping the calls to backends
+
+    Calls made from a worker of the shared pool are run in sequence (the pool would wait for itself)
+
+    :param action: function to call
+    :param kwargs_list: keyword arguments to use for each call
+
+    :type action: function
+    :type kwargs_list: list of dict
+
+    :returns: the results of the calls, in the same order as *kwargs_list*
+    :rtype: list
+
+    :raises Exception: the first exception raised by a call (once all calls are done)
+    """
+    if len(kwargs_list) < 2 or threading.current_thread().name.startswith(_REQUESTS_POOL_PREFIX):
+        return [action(**kwargs) for kwargs in kwargs_list]
+
+    pool = _requests_pool()
+    futures = [pool.submit(action, **kwargs) for kwargs in kwargs_list]
+    wait(futures)
+    return [future.result() for future in futures]
 
 
 class IkatsGenericApiEndPoint:
@@ -20,7 +20,7 @@ from ikats.client.datamodel_client import DatamodelClient
 from ikats.client.datamodel_stub import DatamodelStub
 from ikats.exceptions import IkatsException
 from ikats.lib import MDType, check_type
-from ikats.manager.generic_mgr_ import IkatsGenericApiEndPoint
+from ikats.manager.generic_mgr_ import IkatsGenericApiEndPoint, run_concurrently
 from ikats.objects import Metadata
 
 
@@ -50,7 +50,7 @@ class IkatsMetadataMgr(IkatsGenericApiEndPoint):
         :type tsuid: str
         :type name: str
         :type value: str or number
-        :type dtype: DTYPE
+        :type dtype: MDType
         :type raise_exception: bool
 
         :returns: the status of the action
@@ -76,6 +76,9 @@ class IkatsMetadataMgr(IkatsGenericApiEndPoint):
             if raise_exception:
                 raise
             return False
+        finally:
+            # Once written (even partially), the cached metadata of this TSUID are outdated
+            Metadata.invalidate(api=self.api, tsuid=tsuid)
 
     def delete(self, tsuid, name, raise_exception=True):
         """
@@ -95,7 +98,55 @@ class IkatsMetadataMgr(IkatsGenericApiEndPoint):
 
         :raises IkatsNotFoundError: if metadata doesn't exist
         """
-        return self.dm_client.metadata_delete(tsuid=tsuid, name=name, raise_exception=raise_exception)
+        try:
+            return self.dm_client.metadata_delete(tsuid=tsuid, name=name, raise_exception=raise_exception)
+        finally:
+            # Once deleted, the cached metadata of this TSUID are outdated
+            Metadata.invalidate(api=self.api, tsuid=tsuid)
+
+    def save_many(self, tsuid, items, raise_exception=True):
+        """
+        Save several metadata associated to the same TSUID into Datamodel
+        Returns a boolean status of the action (True means "OK", False means "errors occurred")
+
+        :param tsuid: timeseries identifier (TSUID)
+        :param items: list of (name, value, dtype) to save
+        :param raise_exception: (optional) Indicates if Ikats exceptions shall be raised (True, default) or not (False)
+
+        :type tsuid: str
+        :type items: list of tuple
+        :type raise_exception: bool
+
+        :returns: the status of the action
+        :rtype: bool
+
+        :raises IkatsConflictError: if a metadata couldn't be saved
+        """
+        return all(run_concurrently(self.save, [
+            dict(tsuid=tsuid, name=name, value=value, dtype=dtype, raise_exception=raise_exception)
+            for name, value, dtype in items]))
+
+    def delete_many(self, tsuid, names, raise_exception=True):
+        """
+        Delete several metadata associated to the same TSUID
+        Returns a boolean status of the action (True means "OK", False means "errors occurred")
+
+        :param tsuid: tsuid associated to these metadata
+        :param names: Names of the metadata to delete
+        :param raise_exception: (optional) Indicates if Ikats exceptions shall be raised (True, default) or not (False)
+
+        :type tsuid: str
+        :type names: list of str
+        :type raise_exception: bool
+
+        :returns: the status of the action
+        :rtype: bool
+
+        :raises IkatsNotFoundError: if a metadata doesn't exist
+        """
+        return all(run_concurrently(self.delete, [
+            dict(tsuid=tsuid, name=name, raise_exception=raise_exception)
+            for name in names]))
 
     def fetch(self, metadata):
         """
@@ -117,12 +168,36 @@ class IkatsMetadataMgr(IkatsGenericApiEndPoint):
         """
 
         check_type(value=metadata, allowed_types=Metadata, raise_exception=True)
-        result = self.dm_client.metadata_get_typed(ts_list=[metadata.tsuid])[metadata.tsuid]
+        return self.fetch_many(tsuids=[metadata.tsuid])[metadata.tsuid]
+
+    def fetch_many(self, tsuids):
+        """
+        Fetch and return metadata information of several TSUID at once
+
+        The returned dict has the following format:
+        {
+          'TSUID1': {
+            'md1':{'value':'value1', 'dtype': 'dtype', 'deleted': False},
+            'md2':{'value':'value2', 'dtype': 'dtype', 'deleted': False}
+          },
+          'TSUID2': {...}
+        }
+
+        :param tsuids: list of TS identifiers
+        :type tsuids: list of str
+
+        :returns: the metadata information of each TSUID
+        :rtype: dict
+
+        :raises TypeError: if *tsuids* is not a list
+        """
+
+        check_type(value=tsuids, allowed_types=list, var_name="tsuids", raise_exception=True)
+        result = self.dm_client.metadata_get_typed(ts_list=tsuids)
 
-        for md in result:
-            # Converts MDType
-            result[md]["dtype"] = result[md]["dtype"]
-            # Flag metadata as "not deleted"
-            result[md]["deleted"] = False
+        for metadata in result.values():
+            for md in metadata.values():
+                # Flag metadata as "not deleted"
+                md["deleted"] = False
 
         return result
@@ -15,42 +15,23 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
+import copy
+import os
+
 from ikats.client.catalog_client import CatalogClient
 from ikats.client.catalog_stub import CatalogStub
 from ikats.client.datamodel_client import DatamodelClient
 from ikats.client.datamodel_stub import DatamodelStub
-from ikats.manager.generic_mgr_ import IkatsGenericApiEndPoint
-from ikats.objects import InOutParam, Operator
-
-
-def merge_json_to_op(op, json):
-    """
-    Map the json keys to operator members
-    Updates the operator
-
-    :param op: operator to update
-    :param json: data containing information to update
+from ikats.manager.generic_mgr_ import IkatsGenericApiEndPoint, run_concurrently
+from ikats.lib import CountedCache, check_type
+from ikats.objects import Operator
 
-    :type op: Operator
-    :type json: dict
-    """
+# Number of reads served by a cached operator description before getting it from catalog again
+# (in case the operator was redeployed meanwhile)
+CATALOG_CACHE_READS = int(os.environ.get("IKATS_OP_CACHE_READS", 64))
 
-    op.op_id = json.get("id", op.op_id)
-    op.desc = json.get("description", op.desc)
-    op.label = json.get("label", op.label)
-    op.family = json.get("family", op.family)
-
-    op.inputs = []
-    for item in json.get("inputs", []):
-        op.inputs.append(InOutParam(json_data=item, api=op.api))
-
-    op.parameters = []
-    for item in json.get("parameters", []):
-        op.parameters.append(InOutParam(json_data=item, api=op.api))
-
-    op.outputs = []
-    for item in json.get("outputs", []):
-        op.outputs.append(InOutParam(json_data=item, api=op.api))
+# Maximum number of operators descriptions kept in cache
+CATALOG_CACHE_SIZE = int(os.environ.get("IKATS_OP_CACHE_SIZE", 256))
 
 
 class IkatsOperatorMgr(IkatsGenericApiEndPoint):
@@ -68,6 +49,9 @@ class IkatsOperatorMgr(IkatsGenericApiEndPoint):
             self.dm_client = DatamodelClient(session=self.api.session)
             self.cat_client = CatalogClient(session=self.api.session)
 
+        # Operators descriptions got from catalog, by name
+        self.__catalog_cache = CountedCache(reads=CATALOG_CACHE_READS, maxsize=CATALOG_CACHE_SIZE)
+
     def list(self):
         """
         Get the list of operators
@@ -75,13 +59,8 @@ class IkatsOperatorMgr(IkatsGenericApiEndPoint):
         :returns: the list of all available operators
         :rtype: list of Operators
         """
-        results = []
         raw_op_list = self.cat_client.get_implementation_list()
-        for item in raw_op_list:
-            op = Operator(api=self.api, name=item.get("name", None))
-            merge_json_to_op(op, item)
-            results.append(op)
-        return results
+        return [Operator(api=self.api, name=item.get("name", None), json_data=item) for item in raw_op_list]
 
     def get(self, name):
         """
@@ -95,10 +74,40 @@ class IkatsOperatorMgr(IkatsGenericApiEndPoint):
 
         :raises IkatsNotFoundError: if no match
         """
-        op = Operator(api=self.api, name=name)
-        raw_op = self.cat_client.get_implementation(name=name)
-        merge_json_to_op(op, raw_op)
-        return op
+        # The description got from catalog is reused for the next reads
+        # Each Operator is built from its own copy so that changes made to it don't reach the cached one
+        raw_op = self.__catalog_cache.get(name, lambda: self.cat_client.get_implementation(name=name))
+        return Operator(api=self.api, name=name, json_data=copy.deepcopy(raw_op))
+
+    def cache_clear(self, name=None):
+        """
+        Forget the operators descriptions already got from catalog
+        Next `get()` will request catalog again
+
+        :param name: (optional) name of the operator to forget (all operators if not provided)
+        :type name: str or None
+        """
+        check_type(value=name, allowed_types=[str, None], var_name="name", raise_exception=True)
+        if name is None:
+            self.__catalog_cache.invalidate()
+        else:
+            self.__catalog_cache.invalidate(match=lambda key: key == name)
+
+    def get_many(self, names):
+        """
+        Get several operators identified by their names
+        Requests to catalog are overlapped
+
+        :param names: Identifiers of the operators (unique names)
+        :type names: list of str
+
+        :returns: the operators, in the same order as *names*
+        :rtype: list of Operator
+
+        :raises IkatsNotFoundError: if one of the operators doesn't exist
+        """
+        check_type(value=names, allowed_types=list, var_name="names", raise_exception=True)
+        return run_concurrently(self.get, [dict(name=name) for name in names])
 
     def run(self, op):
         """
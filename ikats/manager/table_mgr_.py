@@ -72,7 +72,8 @@ class IkatsTableMgr(IkatsGenericApiEndPoint):
         check_type(value=name, allowed_types=str, var_name="name", raise_exception=True)
 
         data = self.dm_client.table_read(name=name)
-        return Table(api=self.api, name=name, data=data)
+        # Tables are checked before being stored, no need to check them again
+        return Table.from_trusted(api=self.api, name=name, data=data)
 
     def save(self, data, name=None, raise_exception=True):
         """
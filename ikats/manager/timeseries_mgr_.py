@@ -17,6 +17,7 @@ limitations under the License.
 """
 
 import re
+from collections import namedtuple
 
 from ikats.client.datamodel_client import DatamodelClient
 from ikats.client.datamodel_stub import DatamodelStub
@@ -27,10 +28,13 @@ from ikats.exceptions import (IkatsConflictError, IkatsException,
 from ikats.lib import (MDType, check_is_fid_valid, check_is_valid_epoch,
                        check_type)
 from ikats.manager.generic_mgr_ import IkatsGenericApiEndPoint
-from ikats.objects import Timeseries
+from ikats.objects import Metadata, Timeseries
 
 NON_INHERITABLE_PATTERN = re.compile("^qual(.)*|ikats(.)*|funcId")
 
+# Lightweight reference to a Timeseries, as listed by the database
+TSRef = namedtuple("TSRef", "tsuid fid")
+
 
 class IkatsTimeseriesMgr(IkatsGenericApiEndPoint):
     """
@@ -107,6 +111,9 @@ class IkatsTimeseriesMgr(IkatsGenericApiEndPoint):
 
         If the timeseries is a new one (object has no tsuid defined), the computation of the metadata is forced
 
+        Generated and inherited metadata are set in *ts.metadata* and saved with its other local changes,
+        all at once
+
         Returns a boolean status of the action (True means "OK", False means "errors occurred")
 
         :param ts: Timeseries object containing information about what to create
@@ -143,29 +150,20 @@ class IkatsTimeseriesMgr(IkatsGenericApiEndPoint):
             start_date, end_date, nb_points = self.tsdb_client.add_points(tsuid=ts.tsuid, data=ts.data)
 
             if generate_metadata:
-                # ikats_start_date
-                self.dm_client.metadata_update(tsuid=ts.tsuid, name='ikats_start_date', value=start_date,
-                                               data_type=MDType.DATE, force_create=True)
                 ts.metadata.set(name='ikats_start_date', value=start_date, dtype=MDType.DATE)
-
-                # ikats_end_date
-                self.dm_client.metadata_update(tsuid=ts.tsuid, name='ikats_end_date', value=end_date,
-                                               data_type=MDType.DATE, force_create=True)
                 ts.metadata.set(name='ikats_end_date', value=end_date, dtype=MDType.DATE)
-
-                # qual_nb_points
-                self.dm_client.metadata_update(tsuid=ts.tsuid, name='qual_nb_points', value=nb_points,
-                                               data_type=MDType.NUMBER, force_create=True)
                 ts.metadata.set(name='qual_nb_points', value=nb_points, dtype=MDType.NUMBER)
 
             # Inherit from parent when it is defined
             if parent is not None:
-                self.inherit(ts=ts, parent=parent)
+                self.__set_inherited(ts=ts, parent=parent)
+
+            # All metadata changes are sent in overlapping requests
+            return ts.metadata.save()
         except IkatsException:
             if raise_exception:
                 raise
             return False
-        return True
 
     def delete(self, ts, raise_exception=True):
         """
@@ -206,7 +204,11 @@ class IkatsTimeseriesMgr(IkatsGenericApiEndPoint):
             else:
                 raise ValueError("Timeseries object shall have set at least tsuid or fid")
 
-        return self.dm_client.ts_delete(tsuid=tsuid, raise_exception=raise_exception)
+        try:
+            return self.dm_client.ts_delete(tsuid=tsuid, raise_exception=raise_exception)
+        finally:
+            # Metadata of the deleted TS shall not be served from cache anymore
+            Metadata.invalidate(api=self.api, tsuid=tsuid)
 
     def list(self):
         """
@@ -219,8 +221,20 @@ class IkatsTimeseriesMgr(IkatsGenericApiEndPoint):
         :rtype: list
         """
 
-        return [Timeseries(tsuid=x["tsuid"], fid=x["funcId"], api=self.api) for x in
-                self.dm_client.get_ts_list()]
+        return [Timeseries(tsuid=x.tsuid, fid=x.fid, api=self.api) for x in self.iter_list()]
+
+    def iter_list(self):
+        """
+        Iterate over all Timeseries references from database without building any Timeseries object
+
+        Use `get` on the yielded references to materialize only the Timeseries you need
+
+        :returns: a generator of TSRef (tsuid, fid)
+        :rtype: generator of TSRef
+        """
+
+        for x in self.dm_client.get_ts_list():
+            yield TSRef(tsuid=x["tsuid"], fid=x["funcId"])
 
     def fetch(self, ts, sd=None, ed=None):
         """
@@ -271,27 +285,40 @@ class IkatsTimeseriesMgr(IkatsGenericApiEndPoint):
     def inherit(self, ts, parent):
         """
         Make a timeseries inherit of parent's metadata according to a pattern (not all metadata inherited)
+        The inherited metadata are set in *ts.metadata* and saved with its other local changes
 
         :param ts: TS object in IKATS (which will inherit)
         :param parent: TS object in IKATS of inheritance parent
 
         :type ts: Timeseries
         :param parent: Timeseries
+
+        :returns: the status of the metadata save
+        :rtype: bool
         """
-        try:
-            result = self.dm_client.metadata_get_typed([parent.tsuid])[parent.tsuid]
+        self.__set_inherited(ts=ts, parent=parent)
+        return ts.metadata.save()
 
-            for meta_name in result:
-                # Flag metadata as "not deleted"
-                result[meta_name]["deleted"] = False
+    def __set_inherited(self, ts, parent):
+        """
+        Set locally in *ts.metadata* the inheritable metadata of *parent*
+
+        :param ts: TS object in IKATS (which will inherit)
+        :param parent: TS object in IKATS of inheritance parent
 
-                if not NON_INHERITABLE_PATTERN.match(meta_name):
-                    self.dm_client.metadata_create(tsuid=ts.tsuid, name=meta_name, value=result[meta_name]["value"],
-                                                   data_type=MDType(result[meta_name]["dtype"]),
-                                                   force_update=True)
+        :type ts: Timeseries
+        :param parent: Timeseries
+        """
+        try:
+            result = self.dm_client.metadata_get_typed([parent.tsuid])[parent.tsuid]
         except(ValueError, TypeError, SystemError) as exception:
             self.api.session.log.warning(
                 "Can't get metadata of parent TS (%s), nothing will be inherited; \nreason: %s", parent, exception)
+            return
+
+        for meta_name, entry in result.items():
+            if not NON_INHERITABLE_PATTERN.match(meta_name):
+                ts.metadata.set(name=meta_name, value=entry["value"], dtype=MDType(entry["dtype"]))
 
     def find_from_meta(self, constraint=None):
         """
@@ -369,6 +396,65 @@ class IkatsTimeseriesMgr(IkatsGenericApiEndPoint):
                 raise
             return None
 
+    def tsuid2fid_many(self, tsuids, raise_exception=True):
+        """
+        Retrieve the functional IDs associated to several TSUID with a single call to database
+
+        :param tsuids: the TSUID to resolve
+        :param raise_exception: Allow to specify if the action shall assert if one of them is not found or not
+
+        :type tsuids: list of str
+        :type raise_exception: bool
+
+        :returns: the functional ID of each TSUID found
+        :rtype: dict
+
+        :raises TypeError: if tsuids is not a list
+        :raises IkatsNotFoundError: if a TSUID has no functional ID (only if *raise_exception* is set)
+        """
+        check_type(value=tsuids, allowed_types=list, var_name="tsuids", raise_exception=True)
+        return self.__resolve_many(criterion_type="tsuids", key="tsuid", value="funcId", criteria=tsuids,
+                                   raise_exception=raise_exception)
+
+    def fid2tsuid_many(self, fids, raise_exception=True):
+        """
+        Retrieve the TSUID associated to several functional IDs with a single call to database
+
+        :param fids: the functional Identifiers to resolve
+        :param raise_exception: Allow to specify if the action shall assert if one of them is not found or not
+
+        :type fids: list of str
+        :type raise_exception: bool
+
+        :returns: the TSUID of each functional ID found
+        :rtype: dict
+
+        :raises TypeError: if fids is not a list
+        :raises IkatsNotFoundError: if a functional ID has no TSUID (only if *raise_exception* is set)
+        """
+        check_type(value=fids, allowed_types=list, var_name="fids", raise_exception=True)
+        for fid in fids:
+            check_is_fid_valid(fid=fid)
+        return self.__resolve_many(criterion_type="funcIds", key="funcId", value="tsuid", criteria=fids,
+                                   raise_exception=raise_exception)
+
+    def __resolve_many(self, criterion_type, key, value, criteria, raise_exception):
+        """
+        Search the functional identifier records matching *criteria* and map their *key* to their *value*
+        """
+        if not criteria:
+            return {}
+        try:
+            found = self.dm_client.search_functional_identifiers(criterion_type=criterion_type,
+                                                                 criteria_list=criteria)
+        except IkatsNotFoundError:
+            found = []
+        result = {x[key]: x[value] for x in found}
+        if raise_exception and len(result) < len(set(criteria)):
+            missing = [x for x in criteria if x not in result]
+            raise IkatsNotFoundError("No match found for %s" % missing)
+        return result
+
     def _create_ref(self, fid):
         """
         Create a reference of timeseries in temporal data database and associate it to fid
@@ -138,24 +138,20 @@ class Dataset(IkatsObject):
 
     def add_ts(self, ts):
         """
-        Append a Timeseries to this Dataset (but no save is performed)
+        Append Timeseries to this Dataset (but no save is performed)
 
-        :param ts: Timeseries identifier or object to append to TS list of this Dataset
-        :type ts: str or Timeseries
+        :param ts: Timeseries identifier or object (or list of them) to append to TS list of this Dataset
+        :type ts: str or Timeseries or list
 
         """
-        if isinstance(ts, str):
-            # Assuming this is a TSUID as a string
-            ts_to_add = [Timeseries(tsuid=ts, api=self.api)]
-        elif isinstance(ts, Timeseries):
+        if isinstance(ts, (str, Timeseries)):
             # Because we use "extend", the input is converted to a list
-            ts_to_add = [ts]
-        elif isinstance(ts, list):
-            ts_to_add = ts
-        else:
+            ts = [ts]
+        elif not isinstance(ts, list):
             raise TypeError("Unknown type for Timeseries to add")
-        self.ts = self.ts.extend(
-            [x if isinstance(x, Timeseries) else Timeseries(tsuid=x, api=self.api) for x in ts_to_add])
+
+        # Items are converted in a single pass (strings are assumed to be TSUID) then appended at once
+        self.ts.extend([x if isinstance(x, Timeseries) else Timeseries(tsuid=x, api=self.api) for x in ts])
 
     def save(self, raise_exception=True):
         """
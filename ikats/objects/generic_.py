@@ -22,6 +22,8 @@ class IkatsObject:
     Generic object for Dataset, Timeseries, Metadata, ...
     """
 
+    __slots__ = ("__api",)
+
     def __init__(self, api):
         """
         :param api: IKATS session to use for connections
@@ -15,16 +15,185 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
+import copy
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
+
 from ikats.exceptions import IkatsNotFoundError
 from ikats.lib import MDType, check_type
 from ikats.objects.generic_ import IkatsObject
 
+# Duration (in seconds) during which fetched metadata are considered up to date
+MD_CACHE_TTL = 30
+
+# Metadata fetched from database by IkatsAPI (see `_MetadataCache`)
+_MD_CACHES = WeakKeyDictionary()
+
+# Local database of a Metadata having nothing from database
+_NO_METADATA = MappingProxyType({})
+
+# Workers refreshing the outdated entries of the caches
+_MD_REFRESH_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Types accepted for the TSUID (checked on each Metadata creation)
+_TSUID_TYPES = (str, type(None))
+
+
+def _to_number(value):
+    """
+    Convert a MDType.NUMBER value: int if the value is integer, float otherwise
+
+    :param value: value to convert
+    :type value: int, float, str
+
+    :returns: the converted value
+    :rtype: int or float
+
+    :raises ValueError: if *value* is not a number
+    """
+    number = float(value)
+    if number.is_integer():
+        return int(number)
+    return number
+
+
+def _keep(value):
+    """
+    Keep the value as is (for types without conversion)
+    """
+    return value
+
+
+# Function converting a metadata value to the python type corresponding to its dtype
+# (other types are kept as is, see `_keep`)
+# Each converter raises ValueError if the value can't be converted
+_COERCERS = {
+    MDType.STRING: str,
+    MDType.NUMBER: _to_number,
+    MDType.DATE: int,
+}
+
+
+def _to_local_db(metadata):
+    """
+    Build a local database of Metadata from the content returned by `api.md.fetch`
+
+    :param metadata: metadata as returned by `api.md.fetch`
+    :type metadata: dict
+
+    :returns: the local database: dict of (value, dtype, deleted) by metadata name
+    :rtype: dict
+    """
+    return {sys.intern(name): (_COERCERS.get(entry["dtype"], _keep)(entry["value"]), entry["dtype"], False)
+            for name, entry in metadata.items()}
+
+
+class _MetadataCache:
+    """
+    Metadata fetched from database through one IkatsAPI, shared by all its Metadata objects
+    Format is: entries["tsuid"] = (fetch date (monotonic clock), read-only local database (see `_to_local_db`))
+    """
+
+    __slots__ = ("entries", "generation", "refreshing", "lock")
+
+    def __init__(self):
+        self.entries = {}
+        # Incremented on each invalidation: metadata fetched before an invalidation are not stored
+        self.generation = 0
+        # TSUID being refreshed in background
+        self.refreshing = set()
+        self.lock = threading.Lock()
+
+    def store(self, tsuid, metadata, fetch_date, generation):
+        """
+        Store the metadata of *tsuid* as a read-only local database,
+        unless an invalidation occurred since *generation* was read (they may be outdated)
+
+        :param tsuid: TS identifier
+        :param metadata: metadata as returned by `api.md.fetch`
+        :param fetch_date: date of the fetch (monotonic clock)
+        :param generation: value of `generation` read before the fetch
+
+        :type tsuid: str
+        :type metadata: dict
+        :type fetch_date: float
+        :type generation: int
+
+        :returns: the local database (stored or not)
+        :rtype: MappingProxyType
+        """
+        local_db = MappingProxyType(_to_local_db(metadata))
+        with self.lock:
+            if self.generation == generation:
+                self.entries[tsuid] = (fetch_date, local_db)
+        return local_db
+
+    def invalidate(self, tsuid):
+        """
+        Drop the metadata of *tsuid*
+
+        :param tsuid: TS identifier
+        :type tsuid: str
+        """
+        with self.lock:
+            self.generation += 1
+            self.entries.pop(tsuid, None)
+
+
+def _cache_of(api):
+    """
+    Get the metadata cache of *api*
+
+    :param api: IkatsAPI to use
+    :type api: IkatsAPI
+
+    :rtype: _MetadataCache
+    """
+    cache = _MD_CACHES.get(api)
+    if cache is None:
+        cache = _MD_CACHES.setdefault(api, _MetadataCache())
+    return cache
+
+
+def _refresh_cache(api, tsuid):
+    """
+    Fetch the metadata of *tsuid* from database and update the cache with them
+
+    :param api: IkatsAPI to use
+    :param tsuid: TS identifier
+
+    :type api: IkatsAPI
+    :type tsuid: str
+    """
+    cache = _cache_of(api)
+    generation = cache.generation
+    try:
+        result = api.md.fetch(metadata=Metadata(api=api, tsuid=tsuid))
+        cache.store(tsuid, result, time.monotonic(), generation)
+    except Exception as exception:
+        # Outdated metadata are kept in cache, the next lazy load will try again
+        api.session.log.warning("Metadata of %s couldn't be refreshed: %s", tsuid, exception)
+    finally:
+        cache.refreshing.discard(tsuid)
+
 
 class Metadata(IkatsObject):
     """
     Collection of Metadata information associated to a TSUID
     No data are fetched directly (lazy mode)
+
+    Metadata loaded lazily are taken from a cache shared by the Metadata of the same IkatsAPI:
+    those fetched less than MD_CACHE_TTL seconds ago are reused without any call to database,
+    older ones are used as is while being refreshed in background.
+    The cache entry of a TSUID is dropped each time its metadata are written through the API
     """
+
+    __slots__ = ("__tsuid", "__data", "__shared", "__repr")
+
     def __init__(self, api, tsuid=None):
         """
         Constructor
@@ -39,8 +208,19 @@ class Metadata(IkatsObject):
 
         # Initialize
         self.__tsuid = None
+
+        # Local changes (None until first set/delete/fetch). Format is:
+        # self.__data["metadata_name"] = (value, dtype, deleted)
+        # 'deleted' flag is used to mark metadata as deleted and trigger the deletion on save action
         self.__data = None
 
+        # Metadata got from database (same format), shared with the cache and the other Metadata of this TSUID.
+        # They are never modified: local changes take precedence over them
+        self.__shared = _NO_METADATA
+
+        # Representation, computed on first use and reset each time the local database or the TSUID changes
+        self.__repr = None
+
         # Assign
         self.tsuid = tsuid
 
@@ -48,16 +228,37 @@ class Metadata(IkatsObject):
     def data(self):
         """
         Raw data object containing the dict of metadata. Format is:
-        self.__data["metadata_name"] = {"value": "x", "dtype": "y", "deleted": False}
+        data["metadata_name"] = {"value": "x", "dtype": "y", "deleted": False}
         'deleted' flag is used to mark metadata as deleted and trigger the deletion on save action
+
+        The dict is built upon each call, modifying it has no effect on metadata.
+        Writing data directly is not available: only set/delete/fetch actions shall have impact on data
         :rtype: dict
         """
-        return self.__data
+        if self.__data is None:
+            return None
+        return {name: {"value": value, "dtype": dtype, "deleted": deleted}
+                for name, (value, dtype, deleted) in self.__items()}
+
+    def __entry(self, name):
+        """
+        Get the (value, dtype, deleted) of a metadata, local changes first
+        A missing metadata is considered as deleted
+        """
+        entry = self.__data.get(name)
+        if entry is None:
+            entry = self.__shared.get(name, (None, None, True))
+        return entry
 
-    @data.setter
-    def data(self, value):
-        # Writing data directly should not be available. Only set/get/delete/fetch actions shall have impact on data
-        pass
+    def __items(self):
+        """
+        Iterate over the (name, (value, dtype, deleted)) of all metadata, local changes taking precedence
+        """
+        for name, entry in self.__shared.items():
+            yield name, self.__data.get(name, entry)
+        for name, entry in self.__data.items():
+            if name not in self.__shared:
+                yield name, entry
 
     @property
     def tsuid(self):
@@ -69,8 +270,10 @@ class Metadata(IkatsObject):
 
     @tsuid.setter
     def tsuid(self, value):
-        check_type(value, [str, None], "tsuid")
+        if not isinstance(value, _TSUID_TYPES):
+            raise TypeError("Type of tsuid shall belong to %s, not %s" % ([str, None], type(value)))
         self.__tsuid = value
+        self.__repr = None
 
     def set(self, name, value, dtype=None):
         """
@@ -83,25 +286,21 @@ class Metadata(IkatsObject):
 
         :type name: str
         :type value: int, float, str
-        :type dtype: DTYPE
+        :type dtype: MDType
+
+        :raises ValueError: if *value* doesn't match *dtype* (eg. not a number for MDType.NUMBER)
         """
         # Empty local database
         if self.__data is None:
             self.__data = dict()
 
-        # Metadata is absent
-        if name not in self.__data:
-            self.__data[name] = dict()
-
-        # Set value
-        self.__data[name]["value"] = value
-        # Reset 'deleted' flag
-        self.__data[name]["deleted"] = False
         # Update dtype to specified value or former value or string (default)
-        if dtype is not None:
-            self.__data[name]["dtype"] = dtype
-        else:
-            self.__data[name]["dtype"] = self.__data[name].get("dtype", MDType.STRING)
+        if dtype is None:
+            dtype = self.__entry(name)[1] or MDType.STRING
+
+        # Set value (formatted depending on its type) and reset 'deleted' flag
+        self.__data[sys.intern(name)] = (_COERCERS.get(dtype, _keep)(value), dtype, False)
+        self.__repr = None
 
     def get(self, name):
         """
@@ -119,22 +318,13 @@ class Metadata(IkatsObject):
 
         # Update metadata if empty
         if self.__data is None:
-            self.fetch()
+            self.__load()
 
-        if name not in self.__data or self.__data[name]["deleted"]:
+        # Values are stored already formatted depending on their type
+        value, _, deleted = self.__entry(name)
+        if deleted:
             raise IkatsNotFoundError("Metadata '%s' not defined" % name)
 
-        value = self.__data[name]["value"]
-
-        # Format the value depending on type
-        if self.__data[name]["dtype"] == MDType.STRING:
-            return str(value)
-        if self.__data[name]["dtype"] == MDType.NUMBER:
-            if float(value).is_integer():
-                return int(value)
-            return float(value)
-        if self.__data[name]["dtype"] == MDType.DATE:
-            return int(value)
         return value
 
     def get_type(self, name):
@@ -146,7 +336,7 @@ class Metadata(IkatsObject):
         :type name: str
 
         :returns: the type of the value
-        :rtype: DTYPE
+        :rtype: MDType
 
         :raises IkatsNotFoundError: if metadata doesn't exist
         """
@@ -156,13 +346,15 @@ class Metadata(IkatsObject):
 
         # Update metadata if empty
         if self.__data is None:
-            self.fetch()
+            self.__load()
+
+        _, dtype, deleted = self.__entry(name)
 
         # A metadata marked as 'deleted' shall not be returned
-        if name not in self.__data or self.__data[name]["deleted"]:
+        if deleted:
             raise IkatsNotFoundError("Metadata '%s' not defined" % name)
 
-        return self.__data[name]["dtype"]
+        return dtype
 
     def save(self):
         """
@@ -172,20 +364,29 @@ class Metadata(IkatsObject):
         - metadata marked as 'deleted' will be deleted on remote database.
           If they don't exist, log the error and return False
 
+        Only the local changes are sent, metadata got from database are left untouched
+
         :returns: the action status: True if everything fine, False otherwise
         :rtype: bool
 
         """
-        result = True
-        for md_name in self.__data:
-            if self.__data[md_name]["deleted"]:
-                result = result and self.api.md.delete(tsuid=self.tsuid, name=md_name)
+        if not self.__data:
+            # No local change
+            return True
+
+        to_save = []
+        to_delete = []
+        for md_name, (value, dtype, deleted) in self.__data.items():
+            if deleted:
+                to_delete.append(md_name)
             else:
-                result = result and self.api.md.save(tsuid=self.tsuid,
-                                                     name=md_name,
-                                                     value=self.__data[md_name]["value"],
-                                                     dtype=self.__data[md_name]["dtype"])
+                to_save.append((md_name, value, dtype))
 
+        result = True
+        if to_save:
+            result = self.api.md.save_many(tsuid=self.tsuid, items=to_save)
+        if to_delete:
+            result = self.api.md.delete_many(tsuid=self.tsuid, names=to_delete) and result
         return result
 
     def delete(self, name):
@@ -206,25 +407,105 @@ class Metadata(IkatsObject):
         if self.__data is None:
             self.__data = dict()
 
-        # Metadata is absent
-        if name not in self.__data:
-            self.__data[name] = dict()
-
-        self.__data[name]["deleted"] = True
+        value, dtype, _ = self.__entry(name)
+        self.__data[sys.intern(name)] = (value, dtype, True)
+        self.__repr = None
 
     def fetch(self):
         """
-        Fetch Metadata for the linked TSUID.
-        Overwrite local cache
+        Fetch Metadata for the linked TSUID from database.
+        Overwrite local cache (local changes are dropped)
         """
         if self.tsuid is None:
             raise ValueError("No TSUID linked")
 
-        # Get the results
-        self.__data = self.api.md.fetch(metadata=self)
+        cache = _cache_of(self.api)
+        generation = cache.generation
+        self.__use(cache.store(self.tsuid, self.api.md.fetch(metadata=self), time.monotonic(), generation))
+
+    def __load(self):
+        """
+        Lazy loading of the Metadata for the linked TSUID, taken from cache if present
+        """
+        if self.tsuid is None:
+            raise ValueError("No TSUID linked")
+
+        cache = _cache_of(self.api)
+        cached = cache.entries.get(self.tsuid)
+        if cached is None:
+            self.fetch()
+            return
+
+        fetch_date, local_db = cached
+        if time.monotonic() - fetch_date >= MD_CACHE_TTL and self.tsuid not in cache.refreshing:
+            cache.refreshing.add(self.tsuid)
+            _MD_REFRESH_POOL.submit(_refresh_cache, self.api, self.tsuid)
+        self.__use(local_db)
+
+    def __use(self, local_db):
+        """
+        Use *local_db* as the metadata got from database, local changes are dropped
+        """
+        # Shared without copy: local changes are kept apart and don't alter the cache
+        self.__shared = local_db
+        self.__data = dict()
+        self.__repr = None
+
+    @staticmethod
+    def prefetch_many(api, tsuids):
+        """
+        Fetch the metadata of several TSUID in a single call to database
+        Subsequent lazy loading of these metadata won't need any other call while they are up to date
+
+        :param api: IkatsAPI to use
+        :param tsuids: TS identifiers whose metadata shall be prefetched
+
+        :type api: IkatsAPI
+        :type tsuids: list of str
+        """
+        cache = _cache_of(api)
+        now = time.monotonic()
+        missing = [tsuid for tsuid in tsuids
+                   if tsuid not in cache.entries or now - cache.entries[tsuid][0] >= MD_CACHE_TTL]
+        if not missing:
+            return
+
+        generation = cache.generation
+        result = api.md.fetch_many(tsuids=missing)
+        now = time.monotonic()
+        for tsuid, metadata in result.items():
+            cache.store(tsuid, metadata, now, generation)
+
+    @staticmethod
+    def invalidate(api, tsuid):
+        """
+        Drop the cached metadata of *tsuid*, the next lazy loading will get them from database
+        To be used as soon as the metadata of this TSUID have been changed in database
+
+        :param api: IkatsAPI used to change the metadata
+        :param tsuid: TS identifier
+
+        :type api: IkatsAPI
+        :type tsuid: str
+        """
+        _cache_of(api).invalidate(tsuid)
+
+    def __deepcopy__(self, memo):
+        # The database got from cache is read-only: the copy shares it and only gets its own local changes
+        md = Metadata(api=self.api, tsuid=self.__tsuid)
+        memo[id(self)] = md
+        md.__data = copy.deepcopy(self.__data, memo)
+        md.__shared = self.__shared
+        return md
 
     def __repr__(self):
-        return "%s Metadata associated to TSUID %s" % (len(self.__data.keys()), self.__tsuid)
+        if self.__repr is None:
+            self.__repr = "%s Metadata associated to TSUID %s" % (len(self), self.__tsuid)
+        return self.__repr
 
     def __len__(self):
-        return len(self.__data.keys())
+        return len(self.__shared) + sum(1 for name in self.__data if name not in self.__shared)
+
+    def __bool__(self):
+        # Truthiness shall not depend on __len__ (which needs a local database)
+        return bool(self.__data) or bool(self.__shared)
@@ -16,17 +16,104 @@ limitations under the License.
 
 """
 
-import json
+import sys
 
-from ikats.lib import check_type
+from ikats.lib import check_type, typed_attrs
 from ikats.objects.generic_ import IkatsObject
 
+try:
+    # Faster json decoder, used when available
+    import orjson as json
+except ImportError:
+    import json
+
+
+_NONE_TYPE = type(None)
+
+# Types allowed for each information provided by catalog to describe an input/parameter/output
+# ('default_values' may be of any type)
+INOUT_SCHEMA = (
+    ("description", (str, _NONE_TYPE)),
+    ("domain", (str, list, _NONE_TYPE)),
+    ("label", (str, _NONE_TYPE)),
+    ("name", (str, _NONE_TYPE)),
+    ("order_index", (int, _NONE_TYPE)),
+    ("type", (str, _NONE_TYPE)),
+)
+
+# Types allowed for each information provided by catalog to describe an operator
+OPERATOR_SCHEMA = (
+    ("id", (str, int, _NONE_TYPE)),
+    ("description", (str, _NONE_TYPE)),
+    ("label", (str, _NONE_TYPE)),
+    ("family", (str, _NONE_TYPE)),
+    ("inputs", (list, _NONE_TYPE)),
+    ("parameters", (list, _NONE_TYPE)),
+    ("outputs", (list, _NONE_TYPE)),
+)
+
+
+def _validate(json_data, schema):
+    """
+    Check in a single pass that the information provided by catalog match the expected types
+
+    :param json_data: information provided by catalog
+    :param schema: (key, allowed types) to check
+
+    :type json_data: dict
+    :type schema: tuple
+
+    :raises TypeError: if *json_data* is not a dict or if an information doesn't belong to the allowed types
+    """
+    check_type(value=json_data, allowed_types=dict, var_name="json_data", raise_exception=True)
+    for key, allowed_types in schema:
+        value = json_data.get(key)
+        if type(value) not in allowed_types:
+            raise TypeError("Type of %s shall belong to %s, not %s" % (key, allowed_types, type(value)))
+
+
+def _intern(value):
+    """
+    Intern a low-cardinality information provided by catalog (type, family, label...)
+    so that operators share the same string instead of keeping their own copy
+
+    :param value: information already checked as str or None
+    :type value: str or None
+
+    :returns: the interned string (or None)
+    :rtype: str or None
+    """
+    return value if value is None else sys.intern(value)
+
+
+def _parse_domain(raw_domain):
+    """
+    Decode a domain provided by catalog as json string
 
+    :param raw_domain: domain as json string
+    :type raw_domain: str
+
+    :returns: the decoded domain
+    :rtype: list
+
+    :raises ValueError: if the domain is not a valid json string
+    :raises TypeError: if the decoded domain is not a list
+    """
+    domain = json.loads(raw_domain)
+    check_type(value=domain, allowed_types=list, var_name="domain", raise_exception=True)
+    return domain
+
+
+@typed_attrs({"rid": [int, str, None], "desc": [str, None], "label": [str, None], "name": [str, None],
+              "order_index": [int, None], "dtype": [str, None]})
 class InOutParam:
     """
     Details about the inputs/outputs/parameters of an operator
     """
 
+    __slots__ = ("_desc", "_domain", "_label", "_name", "_order_index", "_dtype", "_default_value", "_rid",
+                 "_api")
+
     def __init__(self, api, json_data=None):
         """
         Constructor
@@ -38,28 +125,55 @@ class InOutParam:
         :type json_data: dict
         """
 
-        self.__desc = None
-        self.__domain = None
-        self.__label = None
-        self.__name = None
-        self.__order_index = None
-        self.__dtype = None
-        self.__default_value = None
-        self.__rid = None
+        self._desc = None
+        self._domain = None
+        self._label = None
+        self._name = None
+        self._order_index = None
+        self._dtype = None
+        self._default_value = None
+        self._rid = None
 
-        self.__api = None
+        self._api = None
         self.api = api
 
         if json_data is not None:
-            check_type(value=json_data, allowed_types=dict, var_name="json_data", raise_exception=True)
+            # Check all the content at once then fill the members directly without going through the setters checks
+            _validate(json_data, INOUT_SCHEMA)
+            self.__fill(json_data)
+
+    @classmethod
+    def from_validated(cls, api, json_data):
+        """
+        Build an input/parameter/output from information already checked against INOUT_SCHEMA
+        No check nor setter is involved
+
+        :param api: see IkatsObject
+        :param json_data: information provided by catalog, already checked
 
-            self.desc = json_data.get("description", None)
-            self.domain = json_data.get("domain", None)
-            self.label = json_data.get("label", None)
-            self.name = json_data.get("name", None)
-            self.order_index = json_data.get("order_index", None)
-            self.dtype = json_data.get("type", None)
-            self.default_value = json_data.get("default_values", None)
+        :type api: IkatsAPI
+        :type json_data: dict
+
+        :returns: the input/parameter/output
+        :rtype: InOutParam
+        """
+        obj = cls.__new__(cls)
+        obj._api = api
+        obj._rid = None
+        obj.__fill(json_data)
+        return obj
+
+    def __fill(self, json_data):
+        """
+        Fill the members from the information provided by catalog
+        """
+        self._desc = json_data.get("description", None)
+        self._domain = json_data.get("domain", None)
+        self._label = _intern(json_data.get("label", None))
+        self._name = _intern(json_data.get("name", None))
+        self._order_index = json_data.get("order_index", None)
+        self._dtype = _intern(json_data.get("type", None))
+        self._default_value = json_data.get("default_values", None)
 
     @property
     def api(self):
@@ -67,11 +181,11 @@ class InOutParam:
         IkatsAPI
         :rtype: IkatsAPI
         """
-        return self.__api
+        return self._api
 
     @api.setter
     def api(self, value):
-        self.__api = value
+        self._api = value
 
     @property
     def rid(self):
@@ -79,12 +193,7 @@ class InOutParam:
         Result ID
         :rtype: int or str
         """
-        return self.__rid
-
-    @rid.setter
-    def rid(self, value):
-        check_type(value=value, allowed_types=[int, str, None], var_name="rid", raise_exception=True)
-        self.__rid = value
+        return self._rid
 
     @property
     def desc(self):
@@ -92,27 +201,28 @@ class InOutParam:
         Input/Parameter/Output description
         :rtype: str
         """
-        return self.__desc
-
-    @desc.setter
-    def desc(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="desc", raise_exception=True)
-        self.__desc = value
+        return self._desc
 
     @property
     def domain(self):
         """
-        Domain of values (json list as str). Used for discrete list
-        :rtype: str
+        Domain of values. Used for discrete list
+
+        The json string provided by catalog is only decoded upon first access
+        :rtype: list
+
+        :raises ValueError: if the domain provided by catalog is not a valid json string
+        :raises TypeError: if the domain provided by catalog is not a json list
         """
-        return self.__domain
+        if isinstance(self._domain, str):
+            self._domain = _parse_domain(self._domain)
+        return self._domain
 
     @domain.setter
     def domain(self, value):
-        if isinstance(value, str):
-            value = json.loads(value)
-        check_type(value=value, allowed_types=[list, None], var_name="domain", raise_exception=True)
-        self.__domain = value
+        # A json list as str is kept raw until first read
+        check_type(value=value, allowed_types=[str, list, None], var_name="domain", raise_exception=True)
+        self._domain = value
 
     @property
     def label(self):
@@ -120,12 +230,7 @@ class InOutParam:
         Input/Parameter/Output displayed name
         :rtype: str
         """
-        return self.__label
-
-    @label.setter
-    def label(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="label", raise_exception=True)
-        self.__label = value
+        return self._label
 
     @property
     def name(self):
@@ -133,12 +238,7 @@ class InOutParam:
         Input/Parameter/Output unique name
         :rtype: str
         """
-        return self.__name
-
-    @name.setter
-    def name(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="name", raise_exception=True)
-        self.__name = value
+        return self._name
 
     @property
     def order_index(self):
@@ -146,12 +246,7 @@ class InOutParam:
         Input/Parameter/Output index in displayed order
         :rtype: int
         """
-        return self.__order_index
-
-    @order_index.setter
-    def order_index(self, value):
-        check_type(value=value, allowed_types=[int, None], var_name="order_index", raise_exception=True)
-        self.__order_index = value
+        return self._order_index
 
     @property
     def dtype(self):
@@ -159,12 +254,7 @@ class InOutParam:
         Input/Parameter/Output data type
         :rtype: str
         """
-        return self.__dtype
-
-    @dtype.setter
-    def dtype(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="dtype", raise_exception=True)
-        self.__dtype = value
+        return self._dtype
 
     @property
     def default_value(self):
@@ -172,11 +262,11 @@ class InOutParam:
         Input/Parameter/Output default value (or default selected value if domain is set)
         :rtype: str
         """
-        return self.__default_value
+        return self._default_value
 
     @default_value.setter
     def default_value(self, value):
-        self.__default_value = value
+        self._default_value = value
 
     def get(self):
         """
@@ -188,46 +278,66 @@ class InOutParam:
         return self.api.op.result(rid=self.rid)
 
 
+@typed_attrs({"family": [str, None], "inputs": list, "parameters": list, "outputs": list, "label": [str, None],
+              "desc": [str, None], "name": [str, None]})
 class Operator(IkatsObject):
     """
     Operator handles the static information of an IKATS operator
     """
 
-    def __init__(self, api, name=None):
+    __slots__ = ("_name", "_label", "_desc", "_op_id", "_family", "_inputs", "_parameters", "_outputs", "_raw_io")
+
+    def __init__(self, api, name=None, json_data=None):
         """
         See props for members description
 
         :param api: see IkatsObject
         :param name: name of the operator to construct
+        :param json_data: information provided by catalog to fill this operator
 
         :type api: IkatsAPI
         :type name: str
+        :type json_data: dict
         """
         super().__init__(api)
-        self.__name = None
-        self.__label = None
-        self.__desc = None
-        self.__op_id = None
-        self.__family = None
-
-        self.__inputs = []
-        self.__parameters = []
-        self.__outputs = []
+        self._name = None
+        self._label = None
+        self._desc = None
+        self._op_id = None
+        self._family = None
+
+        # Inputs, parameters and outputs are loaded upon first access (None means "not loaded yet")
+        self._inputs = None
+        self._parameters = None
+        self._outputs = None
+        # Descriptions of inputs, parameters and outputs provided by catalog, not built yet
+        self._raw_io = None
 
         self.name = name
 
+        if json_data is not None:
+            # Check the whole description (inputs/parameters/outputs included) at once
+            # then fill the members directly without going through the setters checks
+            _validate(json_data, OPERATOR_SCHEMA)
+            for key in ("inputs", "parameters", "outputs"):
+                for item in json_data.get(key, None) or []:
+                    _validate(item, INOUT_SCHEMA)
+            op_id = json_data.get("id", None)
+            self._op_id = None if op_id is None else int(op_id)
+            self._desc = json_data.get("description", None)
+            self._label = _intern(json_data.get("label", None))
+            self._family = _intern(json_data.get("family", None))
+            self._raw_io = (json_data.get("inputs", None) or [],
+                            json_data.get("parameters", None) or [],
+                            json_data.get("outputs", None) or [])
+
     @property
     def family(self):
         """
         Family this operator belongs to
         :rtype: str
         """
-        return self.__family
-
-    @family.setter
-    def family(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="family", raise_exception=True)
-        self.__family = value
+        return self._family
 
     @property
     def inputs(self):
@@ -235,12 +345,9 @@ class Operator(IkatsObject):
         List of inputs used by this operator
         :rtype: list of InOutParam
         """
-        return self.__inputs
-
-    @inputs.setter
-    def inputs(self, value):
-        check_type(value=value, allowed_types=list, var_name="inputs", raise_exception=True)
-        self.__inputs = value
+        if self._inputs is None:
+            self.__load_io()
+        return self._inputs
 
     @property
     def parameters(self):
@@ -248,12 +355,9 @@ class Operator(IkatsObject):
         List of parameters used by this operator
         :rtype: list of InOutParam
         """
-        return self.__parameters
-
-    @parameters.setter
-    def parameters(self, value):
-        check_type(value=value, allowed_types=list, var_name="parameters", raise_exception=True)
-        self.__parameters = value
+        if self._parameters is None:
+            self.__load_io()
+        return self._parameters
 
     @property
     def outputs(self):
@@ -261,12 +365,9 @@ class Operator(IkatsObject):
         List of outputs used by this operator
         :rtype: list of InOutParam
         """
-        return self.__outputs
-
-    @outputs.setter
-    def outputs(self, value):
-        check_type(value=value, allowed_types=list, var_name="outputs", raise_exception=True)
-        self.__outputs = value
+        if self._outputs is None:
+            self.__load_io()
+        return self._outputs
 
     @property
     def label(self):
@@ -274,12 +375,7 @@ class Operator(IkatsObject):
         Short name of the operator used in GUI
         :rtype: str
         """
-        return self.__label
-
-    @label.setter
-    def label(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="label", raise_exception=True)
-        self.__label = value
+        return self._label
 
     @property
     def desc(self):
@@ -287,12 +383,7 @@ class Operator(IkatsObject):
         Short description of the operator
         :rtype: str
         """
-        return self.__desc
-
-    @desc.setter
-    def desc(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="desc", raise_exception=True)
-        self.__desc = value
+        return self._desc
 
     @property
     def op_id(self):
@@ -300,14 +391,14 @@ class Operator(IkatsObject):
         Internal ID of the operator
         :rtype: int
         """
-        return self.__op_id
+        return self._op_id
 
     @op_id.setter
     def op_id(self, value):
         check_type(value=value, allowed_types=[str, int, None], var_name="op_id", raise_exception=True)
         if value is not None:
             value = int(value)
-        self.__op_id = value
+        self._op_id = value
 
     @property
     def name(self):
@@ -315,12 +406,30 @@ class Operator(IkatsObject):
         Unique name of the operator
         :rtype: str
         """
-        return self.__name
-
-    @name.setter
-    def name(self, value):
-        check_type(value=value, allowed_types=[str, None], var_name="name", raise_exception=True)
-        self.__name = value
+        return self._name
+
+    def __load_io(self):
+        """
+        Load inputs, parameters and outputs on first access to one of them
+        They are built from the catalog description if provided at construction
+        A local operator (without name) has none of them
+        """
+        if self._raw_io is not None:
+            raw_inputs, raw_parameters, raw_outputs = self._raw_io
+            self._raw_io = None
+            from_validated = InOutParam.from_validated
+            if self._inputs is None:
+                self._inputs = [from_validated(self.api, x) for x in raw_inputs]
+            if self._parameters is None:
+                self._parameters = [from_validated(self.api, x) for x in raw_parameters]
+            if self._outputs is None:
+                self._outputs = [from_validated(self.api, x) for x in raw_outputs]
+        elif self.name is None:
+            self._inputs = []
+            self._parameters = []
+            self._outputs = []
+        else:
+            self.fetch()
 
     def fetch(self):
         """
@@ -332,12 +441,14 @@ class Operator(IkatsObject):
 
         result = self.api.op.get(name=self.name)
 
-        self.desc = result.desc
-        self.label = result.label
-        self.op_id = result.op_id
-        self.inputs = result.inputs
-        self.parameters = result.parameters
-        self.outputs = result.outputs
+        # result is a fresh Operator whose members were already checked: take them as is
+        self._desc = result._desc
+        self._label = result._label
+        self._op_id = result._op_id
+        self._family = result._family
+        self._inputs = result.inputs
+        self._parameters = result.parameters
+        self._outputs = result.outputs
 
     def __str__(self):
         return "Operator %s" % self.name
@@ -346,10 +457,14 @@ class Operator(IkatsObject):
         return "Operator %s" % self.name
 
 
+@typed_attrs({"pid": [int, None]})
 class RunOp(Operator):
     """
     Operator class with necessary elements to be runnable
     """
+
+    __slots__ = ("_pid", "_results")
+
     def __init__(self, name):
         """
         Constructor
@@ -358,8 +473,8 @@ class RunOp(Operator):
         :type name: str
         """
         super().__init__(name)
-        self.__pid = None
-        self.__results = None
+        self._pid = None
+        self._results = None
 
     @property
     def pid(self):
@@ -367,12 +482,7 @@ class RunOp(Operator):
         Unique identifier of the process ID
         :rtype: str or int
         """
-        return self.__pid
-
-    @pid.setter
-    def pid(self, value):
-        check_type(value=value, allowed_types=[int, None], var_name="pid", raise_exception=True)
-        self.__pid = value
+        return self._pid
 
     def results(self):
         """
@@ -15,12 +15,69 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
+import ipaddress
 import logging
 import re
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ikats.lib import check_type
 
+# Number of pooled connections kept per backend host
+POOL_SIZE = 64
+
+# Retry policy applied to idempotent requests when a backend is temporarily unavailable
+# (gateway errors only: an unreachable backend fails at once)
+RETRY_POLICY = Retry(total=3, connect=0, read=0, status=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                     raise_on_status=False)
+
+# Pattern of the accepted hosts (compiled once for all sessions)
+HOST_REGEX = re.compile(
+    r'^(?:http)s?://'  # http:// or https://
+    r'(?P<hostname>(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # Domain
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ... or IP
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+
+def _is_valid_ip(hostname):
+    """
+    Check the hostname is a valid IP address when it is made of numbers only (eg. 999.1.1.1 is not)
+    Other hostnames are considered valid
+
+    :param hostname: host name part of the URL
+    :type hostname: str
+
+    :returns: the check status
+    :rtype: bool
+    """
+    if not hostname.replace(".", "").isdigit():
+        return True
+    try:
+        ipaddress.ip_address(hostname)
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=128)
+def _is_valid_host(host):
+    """
+    Check the host is a well formed URL to the GUI
+    Results are kept since the same hosts are checked by each new session
+
+    :param host: URL or IP to the GUI
+    :type host: str
+
+    :returns: the check status
+    :rtype: bool
+    """
+    match = HOST_REGEX.match(host)
+    return match is not None and _is_valid_ip(match.group("hostname"))
+
 
 class IkatsSession:
     """
@@ -29,6 +86,9 @@ class IkatsSession:
     The IKATS entry point shall be set to the main GUI URL and port.
     """
 
+    __slots__ = ("_host", "_port", "_catalog_path", "_engine_path", "_dm_path", "_tsdb_path",
+                 "_catalog_url", "_engine_url", "_dm_url", "_tsdb_url", "_sc", "_rs", "name", "log")
+
     def __init__(self, host="http://localhost", port="80", sc=None, name="IKATS_SESSION"):
         """
         Initialize the session
@@ -45,20 +105,29 @@ class IkatsSession:
         """
 
         # Host name and port of the GUI
-        self.__host = None
-        self.__port = None
+        self._host = None
+        self._port = None
+
+        # Path to backends REST API (relative to host and port)
+        self._catalog_path = None
+        self._engine_path = None
+        self._dm_path = None
+        self._tsdb_path = None
 
-        # URL to backends REST API
-        self.__catalog_url = None
-        self.__engine_url = None
-        self.__dm_url = None
-        self.__tsdb_url = None
+        # URL to backends REST API, built again each time the host or the port changes
+        self._catalog_url = None
+        self._engine_url = None
+        self._dm_url = None
+        self._tsdb_url = None
 
         # Spark Context/Session
-        self.__sc = None
+        self._sc = None
 
         # Requests Session
-        self.__rs = requests.session()
+        self._rs = requests.session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY_POLICY)
+        self._rs.mount("http://", adapter)
+        self._rs.mount("https://", adapter)
 
         # Initialization
         self.host = host
@@ -72,7 +141,9 @@ class IkatsSession:
 
         self.name = name
         self.log = logging.getLogger(str(self.name))
-        self.log.addHandler(logging.StreamHandler())
+        # Loggers are shared by name: only the first session of a given name adds the handler
+        if not self.log.handlers:
+            self.log.addHandler(logging.StreamHandler())
         self.log.setLevel(logging.DEBUG)
 
         # Set the requests modules minimum logger to Warning
@@ -85,12 +156,12 @@ class IkatsSession:
         requests Session
         :rtype: requests.Session
         """
-        return self.__rs
+        return self._rs
 
     @rs.setter
     def rs(self, value):
         check_type(value=value, allowed_types=requests.Session, var_name="rs", raise_exception=True)
-        self.__rs = value
+        self._rs = value
 
     @property
     def host(self):
@@ -98,21 +169,14 @@ class IkatsSession:
         Hostname of the IKATS backend
         :rtype: str
         """
-        return self.__host
+        return self._host
 
     @host.setter
     def host(self, value):
-        regex = re.compile(
-            r'^(?:http)s?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # Domain
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ... or IP
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-        if re.match(regex, value) is not None:
-            self.__host = str(value)
-        else:
+        if not _is_valid_host(value):
             raise ValueError("Malformed host name: %s" % value)
+        self._host = str(value)
+        self.__build_urls()
 
     @property
     def port(self):
@@ -120,16 +184,41 @@ class IkatsSession:
         Port of the backend
         :rtype: int
         """
-        return self.__port
+        return self._port
 
     @port.setter
     def port(self, value):
         check_type(value=value, allowed_types=[int, str, float, None], var_name="port", raise_exception=True)
 
-        if int(value) <= 0 or int(value) >= 65535:
+        port = int(value)
+        if port <= 0 or port >= 65535:
             raise ValueError("Port must be within ]0;65535] (got %s)" % value)
 
-        self.__port = int(value)
+        self._port = port
+        self.__build_urls()
+
+    def __build_url(self, path):
+        """
+        Build the URL to a backend from current host and port
+
+        :param path: path of the backend REST API
+        :type path: str or None
+
+        :returns: the URL (None if path is not defined yet)
+        :rtype: str or None
+        """
+        if path is None:
+            return None
+        return "{}:{}{}".format(self._host, self._port, path)
+
+    def __build_urls(self):
+        """
+        Build again the URL to backends with current host and port
+        """
+        self._catalog_url = self.__build_url(self._catalog_path)
+        self._engine_url = self.__build_url(self._engine_path)
+        self._dm_url = self.__build_url(self._dm_path)
+        self._tsdb_url = self.__build_url(self._tsdb_path)
 
     @property
     def dm_url(self):
@@ -137,11 +226,12 @@ class IkatsSession:
         URL of the Datamodel API
         :rtype: str
         """
-        return self.__dm_url
+        return self._dm_url
 
     @dm_url.setter
     def dm_url(self, value):
-        self.__dm_url = "{}:{}{}".format(self.host, self.port, value)
+        self._dm_path = value
+        self._dm_url = self.__build_url(value)
 
     @property
     def tsdb_url(self):
@@ -149,11 +239,12 @@ class IkatsSession:
         URL of the Timeseries database
         :rtype: str
         """
-        return self.__tsdb_url
+        return self._tsdb_url
 
     @tsdb_url.setter
     def tsdb_url(self, value):
-        self.__tsdb_url = "{}:{}{}".format(self.host, self.port, value)
+        self._tsdb_path = value
+        self._tsdb_url = self.__build_url(value)
 
     @property
     def engine_url(self):
@@ -161,12 +252,12 @@ class IkatsSession:
         URL of the Operator runner engine
         :rtype: str
         """
-        return self.__engine_url
+        return self._engine_url
 
     @engine_url.setter
     def engine_url(self, value):
-
-        self.__engine_url = "{}:{}{}".format(self.host, self.port, value)
+        self._engine_path = value
+        self._engine_url = self.__build_url(value)
 
     @property
     def catalog_url(self):
@@ -174,11 +265,12 @@ class IkatsSession:
         URL of the Catalog backend
         :rtype: str
         """
-        return self.__catalog_url
+        return self._catalog_url
 
     @catalog_url.setter
     def catalog_url(self, value):
-        self.__catalog_url = "{}:{}{}".format(self.host, self.port, value)
+        self._catalog_path = value
+        self._catalog_url = self.__build_url(value)
 
     @property
     def sc(self):
@@ -186,11 +278,11 @@ class IkatsSession:
         Spark Context
         :rtype: SparkContext
         """
-        return self.__sc
+        return self._sc
 
     @sc.setter
     def sc(self, value):
-        self.__sc = value
+        self._sc = value
 
     def __repr__(self):
         return str("IKATS session to {}:{}".format(self.host, self.port))
@@ -15,33 +15,34 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
-from schema import And, Optional, Schema, SchemaError, Use
+import numpy as np
+from schema import Optional, Schema, SchemaError, Use
 
 from ikats.lib import check_type
 from ikats.objects.generic_ import IkatsObject
 
 TABLE_SCHEMA = Schema({
     Optional('table_desc'): {
-        'name': And(Use(str)),
-        'title': And(Use(str)),
-        'desc': And(Use(str)),
+        'name': Use(str),
+        'title': Use(str),
+        'desc': Use(str),
     },
     Optional('headers'): {
         Optional('col'): {
-            'data': And(Use(list)),
-            Optional('default_links'): {'type': And(Use(str)), 'context': And(Use(str))},
-            Optional('links'): And(Use(list))
+            'data': Use(list),
+            Optional('default_links'): {'type': Use(str), 'context': Use(str)},
+            Optional('links'): Use(list)
         },
         Optional('row'): {
-            'data': And(Use(list)),
-            Optional('default_links'): {'type': And(Use(str)), 'context': And(Use(str))},
-            Optional('links'): And(Use(list))
+            'data': Use(list),
+            Optional('default_links'): {'type': Use(str), 'context': Use(str)},
+            Optional('links'): Use(list)
         },
     },
     'content': {
-        'cells': And(Use(list)),
-        Optional('default_links'): {'type': And(Use(str)), 'context': And(Use(str))},
-        Optional('links'): And(Use(list))
+        'cells': Use(list),
+        Optional('default_links'): {'type': Use(str), 'context': Use(str)},
+        Optional('links'): Use(list)
     }
 })
 
@@ -50,6 +51,9 @@ class Table(IkatsObject):
     """
     Table class
     """
+
+    __slots__ = ("_name", "_desc", "_data")
+
     def __init__(self, api, name=None, data=None):
         """
         See props for members description
@@ -65,13 +69,15 @@ class Table(IkatsObject):
 
         # Internal variables initialization
         super().__init__(api)
-        self.__name = None
-        self.__desc = None
-        self.__data = dict()
+        self._name = None
+        self._desc = None
+        self._data = dict()
 
         # Initialization with provided parameters
-        self.name = name
+        # The name found in data takes precedence over the provided one
         self.data = data
+        if self._name is None:
+            self.name = name
 
     @property
     def name(self):
@@ -79,18 +85,18 @@ class Table(IkatsObject):
         Name of the dataset
         :rtype: str
         """
-        return self.__name
+        return self._name
 
     @name.setter
     def name(self, value):
         check_type(value=value, allowed_types=[str, None], var_name="name", raise_exception=True)
         if value is not None:
-            self.__name = value
-        if self.__data is not None:
-            try:
-                self.__data['table_desc']['name'] = value
-            except KeyError:
-                pass
+            self._name = value
+        if self._data:
+            table_desc = self._data.get('table_desc')
+            # Only write the name in data if it changes
+            if table_desc is not None and table_desc.get('name') != value:
+                table_desc['name'] = value
 
     @property
     def data(self):
@@ -99,20 +105,47 @@ class Table(IkatsObject):
         The mapping is close to the JSON format that is exchanged with backend
         :rtype: dict
         """
-        return self.__data
+        return self._data
 
     @data.setter
     def data(self, value):
         check_type(value=value, allowed_types=[dict, None], var_name="name", raise_exception=True)
         if value is not None:
             self.is_json_valid(data=value)
+
+        self._data = value
+
+        if value is not None:
             try:
                 self.name = value['table_desc']['name']
             except KeyError:
                 # The data doesn't contain the name, just skip this part
                 pass
 
-        self.__data = value
+    @classmethod
+    def from_trusted(cls, api, name, data):
+        """
+        Build a Table from data known to be valid (as read from database) without checking it again
+
+        :param api: see IkatsObject
+        :param name: Name of the Table
+        :param data: Data composing the Table
+
+        :type api: IkatsAPI
+        :type name: str
+        :type data: dict
+
+        :returns: the Table object
+        :rtype: Table
+        """
+        table = cls(api=api, name=name)
+        table._data = data
+        try:
+            table._name = data['table_desc']['name']
+        except KeyError:
+            # The data doesn't contain the name, keep the provided one
+            pass
+        return table
 
     def __str__(self):
         return self.name
@@ -196,38 +229,76 @@ class Table(IkatsObject):
         check_type(value=obs_id, allowed_types=str, var_name="obs_id", raise_exception=True)
         check_type(value=items, allowed_types=list, var_name="items", raise_exception=True)
 
-        # 2D array containing the equivalent of the rendered JSON structure
-        data_array = []
+        # Resolve the table parts once
+        data = self.data
+        cells = data["content"]["cells"]
+        headers = data.get("headers", {})
+        col_headers = headers.get("col", {}).get("data")
+        row_headers = headers.get("row", {}).get("data")
 
-        try:
-            # Get the columns name with a mapping dict
-            columns_name = {k: v for v, k in enumerate(self.data["headers"]["col"]["data"])}
-        except KeyError:
+        if col_headers is None:
             raise ValueError("Table content shall contain col headers to know the name of columns")
+        # Get the columns name with a mapping dict
+        columns_name = {k: v for v, k in enumerate(col_headers)}
 
-        try:
-            # Fill the 2D array with the content of the header column
+        if row_headers is not None:
+            # The header column is the first column of the table
             # Skip the first cell by starting at index 1
-            data_array = [[x] for x in self.data["headers"]["row"]["data"][1:]]
-        except KeyError:
-            # No header column present, skip it
-            pass
-
-        # Building final computed results
-        results = {}
-        for line_index, line in enumerate(self.data["content"]["cells"]):
-            if len(data_array) < line_index:
-                # Fill in the data_array line with an empty list in case there was no header column
-                data_array.append([])
-            # Extend the current column with the other columns
-            data_array[line_index].extend(line)
-
-            first_key_value = data_array[line_index][columns_name[obs_id]]
+            row_headers = row_headers[1:]
+
+        # Resolve the columns indexes once for all lines
+        obs_index = columns_name[obs_id]
+        items_indexes = [(item, columns_name[item]) for item in items]
+
+        results = self.__extract_columns(cells, row_headers, obs_id, obs_index, items, [x[1] for x in items_indexes])
+        if results is not None:
+            return results
+
+        # Building final computed results line by line (ragged content)
+        # Cells are read in place: column indexes are shifted to the line positions
+        # and the header column (if any) gets the index -1
+        offset = 0 if row_headers is None else 1
+        key_index = obs_index - offset
+        items_positions = [(item, index - offset) for item, index in items_indexes]
+        headers = row_headers if row_headers is not None else [None] * len(cells)
+
+        # Check the keys uniqueness in a single pass before building the results
+        keys = [line[key_index] if key_index >= 0 else header for header, line in zip(headers, cells)]
+        if len(keys) != len(cells):
+            raise IndexError("Missing row headers")
+        if len(set(keys)) != len(keys):
+            raise ValueError("Key %s is not unique" % obs_id)
+
+        results = dict.fromkeys(keys)
+        for key, header, line in zip(keys, headers, cells):
+            results[key] = {item: line[position] if position >= 0 else header for item, position in items_positions}
+        return results
 
-            if first_key_value in results:
-                raise ValueError("Key %s is not unique" % obs_id)
+    @staticmethod
+    def __extract_columns(cells, row_headers, obs_id, obs_index, items, items_indexes):
+        """
+        Column-wise version of `extract()` for rectangular tables: the columns are selected by numpy instead of
+        going through each line
 
-            results[first_key_value] = {}
-            for item in items:
-                results[first_key_value][item] = data_array[line_index][columns_name[item]]
-        return results
+        :returns: the same result as `extract()` or None if the content is not rectangular
+        :rtype: dict or None
+        """
+        if not cells or (row_headers is not None and len(row_headers) != len(cells)):
+            return None
+        try:
+            content = np.array(cells, dtype=object)
+        except ValueError:
+            # Ragged lines
+            return None
+        if content.ndim != 2:
+            return None
+        if row_headers is not None:
+            headers_column = np.empty((len(row_headers), 1), dtype=object)
+            headers_column[:, 0] = row_headers
+            content = np.concatenate((headers_column, content), axis=1)
+
+        keys = content[:, obs_index].tolist()
+        if len(set(keys)) != len(keys):
+            raise ValueError("Key %s is not unique" % obs_id)
+        values = content[:, items_indexes].tolist()
+        return {key: dict(zip(items, line)) for key, line in zip(keys, values)}
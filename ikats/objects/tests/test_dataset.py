@@ -28,11 +28,17 @@ class TestDataset(TestCase):
     """
     Test Dataset object
     """
+
+    @classmethod
+    def setUpClass(cls):
+        # A single API (and its sessions) is shared by all tests
+        cls.api = IkatsAPI()
+
     def test_new(self):
         """
         Creation of a Dataset instance
         """
-        api = IkatsAPI()
+        api = self.api
 
         # Empty
         ds = api.ds.new()
@@ -59,7 +65,7 @@ class TestDataset(TestCase):
         """
         Get an existing dataset
         """
-        api = IkatsAPI()
+        api = self.api
 
         # Empty
         ds = api.ds.get(name="Portfolio")
@@ -70,7 +76,7 @@ class TestDataset(TestCase):
         """
         Add new TS to dataset
         """
-        api = IkatsAPI()
+        api = self.api
         ts_list1 = [api.ts.new() for _ in range(10)]
         ts_list2 = [api.ts.new() for _ in range(11, 20)]
 
@@ -97,7 +103,7 @@ class TestDataset(TestCase):
         """
         Non-nominal usage
         """
-        api = IkatsAPI()
+        api = self.api
         ds = api.ds.new()
 
         for value in [42, [1, 2, 3], {'k': 'v'}]:
@@ -112,10 +118,9 @@ class TestDataset(TestCase):
         """
 
         # Cleanup
-        api = IkatsAPI()
+        api = self.api
         api.ds.delete(name="DS_TEST", deep=True, raise_exception=False)
-        for i in range(10):
-            delete_ts_if_exists(fid="FID_TEST_%s" % i)
+        delete_ts_if_exists(fid=["FID_TEST_%s" % i for i in range(10)])
 
         # Setup
         ts_list1 = [api.ts.new(fid="FID_TEST_%s" % i) for i in range(10)]
@@ -15,12 +15,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 """
-
+import threading
+import time
 from unittest import TestCase
 
 from ikats.api import IkatsAPI
 from ikats.exceptions import IkatsNotFoundError
 from ikats.lib import MDType
+from ikats.manager.generic_mgr_ import MAX_PARALLEL_REQUESTS
+from ikats.objects import Metadata
 from ikats.tests.lib import delete_ts_if_exists
 
 
@@ -29,13 +32,17 @@ class TestMetadata(TestCase):
     Test Metadata object
     """
 
+    @classmethod
+    def setUpClass(cls):
+        cls.api = IkatsAPI()
+
     def test_types(self):
         """
         Creation of a Metadata instance
         """
 
         # Init
-        api = IkatsAPI()
+        api = self.api
         delete_ts_if_exists("MyTS")
         ts = api.ts.new(fid="MyTS")
 
@@ -78,7 +85,7 @@ class TestMetadata(TestCase):
         Nominal use case for Metadata from creation to deletion
         """
         # Init
-        api = IkatsAPI()
+        api = self.api
         delete_ts_if_exists(fid="MyTS")
         ts_1 = api.ts.new(fid="MyTS")
 
@@ -125,3 +132,127 @@ class TestMetadata(TestCase):
         md = ts_2.metadata
         self.assertEqual("%s Metadata associated to TSUID %s" % (len(md.data), ts_2.tsuid), repr(md))
         self.assertEqual(len(md.data), len(md))
+
+    def test_prefetch_many(self):
+        """
+        Metadata of several TS prefetched at once are available without any other call
+        """
+        # Init
+        api = self.api
+        delete_ts_if_exists(fid="MyTS")
+        ts = api.ts.new(fid="MyTS")
+        ts.metadata.set(name="myMD", value=42, dtype=MDType.NUMBER)
+        self.assertTrue(ts.metadata.save())
+
+        Metadata.prefetch_many(api=api, tsuids=[ts.tsuid])
+
+        ts_2 = api.ts.get(fid="MyTS")
+        self.assertEqual(42, ts_2.metadata.get("myMD"))
+        self.assertEqual(MDType.NUMBER, ts_2.metadata.get_type("myMD"))
+
+        ts.delete()
+
+    def test_repr(self):
+        """
+        Representation follows the local changes and the TSUID
+        """
+        md = Metadata(api=self.api, tsuid="TSUID1")
+        md.set(name="md1", value=1, dtype=MDType.NUMBER)
+        self.assertEqual("1 Metadata associated to TSUID TSUID1", repr(md))
+
+        md.set(name="md2", value="a")
+        self.assertEqual("2 Metadata associated to TSUID TSUID1", repr(md))
+
+        md.tsuid = "TSUID2"
+        self.assertEqual("2 Metadata associated to TSUID TSUID2", repr(md))
+
+    def test_shared_fetch(self):
+        """
+        Metadata of the same TSUID share what was fetched while keeping their local changes apart
+        """
+        # Emulated database
+        api = IkatsAPI(emulate=True)
+        tsuid = "SHARED_FETCH_TSUID"
+        api.md.save(tsuid=tsuid, name="md1", value=1, dtype=MDType.NUMBER)
+        api.md.save(tsuid=tsuid, name="md2", value="a", dtype=MDType.STRING)
+
+        md_1 = Metadata(api=api, tsuid=tsuid)
+        md_1.fetch()
+        md_2 = Metadata(api=api, tsuid=tsuid)
+
+        md_1.set(name="md1", value=2)
+        md_1.set(name="md3", value="b")
+        md_1.delete(name="md2")
+        self.assertEqual(2, md_1.get("md1"))
+        self.assertEqual(MDType.NUMBER, md_1.get_type("md1"))
+        self.assertEqual(["md1", "md2", "md3"], list(md_1.data))
+        self.assertEqual(3, len(md_1))
+        with self.assertRaises(IkatsNotFoundError):
+            md_1.get("md2")
+
+        # Other Metadata are not impacted
+        self.assertEqual(1, md_2.get("md1"))
+        self.assertEqual("a", md_2.get("md2"))
+        self.assertEqual(2, len(md_2))
+
+        # Local changes are dropped upon fetch
+        md_1.fetch()
+        self.assertEqual(1, md_1.get("md1"))
+
+        # cleanup
+        api.md.delete_many(tsuid=tsuid, names=["md1", "md2"])
+
+    def test_cache_consistency(self):
+        """
+        Metadata written through the API or changed elsewhere are not served from an outdated cache
+        """
+        # Emulated database
+        api = IkatsAPI(emulate=True)
+        tsuid = "CACHE_CONSISTENCY_TSUID"
+        api.md.save(tsuid=tsuid, name="unit", value="m")
+
+        # Lazy loading puts metadata in cache
+        self.assertEqual("m", Metadata(api=api, tsuid=tsuid).get("unit"))
+
+        # Writes through the API drop the cache entry
+        api.md.save(tsuid=tsuid, name="unit", value="km")
+        self.assertEqual("km", Metadata(api=api, tsuid=tsuid).get("unit"))
+
+        # Change made by another client: explicit fetch reads the database, other APIs have their own cache
+        api.md.dm_client.metadata_create(tsuid=tsuid, name="unit", value="mm")
+        self.assertEqual("km", Metadata(api=api, tsuid=tsuid).get("unit"))
+        md = Metadata(api=api, tsuid=tsuid)
+        md.fetch()
+        self.assertEqual("mm", md.get("unit"))
+        self.assertEqual("mm", Metadata(api=IkatsAPI(emulate=True), tsuid=tsuid).get("unit"))
+
+        # cleanup
+        api.md.delete(tsuid=tsuid, name="unit")
+
+    def test_save_many_workers(self):
+        """
+        Successive saves of several metadata reuse the same workers
+        """
+        workers = set()
+
+        class RecordingDatamodel:
+            """
+            Database recording the threads writing into it
+            """
+
+            @staticmethod
+            def metadata_create(**kwargs):
+                """
+                Record the thread saving the metadata
+                """
+                workers.add(threading.current_thread())
+                time.sleep(0.001)
+                return True
+
+        api = IkatsAPI(emulate=True)
+        api.md.dm_client = RecordingDatamodel()
+        items = [("md%s" % i, 1, MDType.NUMBER) for i in range(MAX_PARALLEL_REQUESTS * 2)]
+        for _ in range(10):
+            self.assertTrue(api.md.save_many(tsuid="SAVE_MANY_TSUID", items=items))
+        self.assertNotIn(threading.current_thread(), workers)
+        self.assertLessEqual(len(workers), MAX_PARALLEL_REQUESTS)
@@ -16,22 +16,29 @@ limitations under the License.
 
 """
 
+import time
 from unittest import TestCase
 
 from ikats import IkatsAPI
 from ikats.exceptions import IkatsNotFoundError
-from ikats.objects import InOutParam
+from ikats.manager import operator_mgr_
+from ikats.objects import InOutParam, Operator
 
 
 class TestOperator(TestCase):
     """
     Test Operator object
     """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = IkatsAPI()
+
     def test_nominal(self):
         """
         Get an Operator instance
         """
-        api = IkatsAPI()
+        api = self.api
 
         op = api.op.get(name="slope_spark")
         self.assertIsNotNone(op.op_id)
@@ -43,5 +50,116 @@ class TestOperator(TestCase):
         self.assertEqual(1, len(op.outputs))
         self.assertEqual(InOutParam, type(op.outputs[0]))
 
+        ops = api.op.get_many(names=["slope_spark", "slope_spark"])
+        self.assertEqual(["slope_spark", "slope_spark"], [x.name for x in ops])
+
         with self.assertRaises(IkatsNotFoundError):
             api.op.results(pid=0)
+
+    def test_from_catalog_description(self):
+        """
+        Build an Operator from the description provided by catalog
+        """
+        api = self.api
+        json_data = {
+            "id": "12",
+            "name": "my_op",
+            "label": "My operator",
+            "description": "Operator description",
+            "family": "Tests",
+            "inputs": [{"name": "ds", "type": "ds_name", "order_index": 0}],
+            "parameters": [{"name": "choice", "type": "list", "domain": '["a", "b"]', "default_values": "a"}],
+            "outputs": [],
+        }
+
+        op = Operator(api=api, name="my_op", json_data=json_data)
+        self.assertEqual(12, op.op_id)
+        self.assertEqual("Tests", op.family)
+        self.assertEqual(["ds"], [x.name for x in op.inputs])
+        self.assertEqual(["a", "b"], op.parameters[0].domain)
+        self.assertEqual([], op.outputs)
+
+        # Each operator gets its own domain
+        other_op = Operator(api=api, name="my_op", json_data=json_data)
+        other_op.parameters[0].domain.append("c")
+        self.assertEqual(["a", "b"], op.parameters[0].domain)
+
+        # Domain provided by catalog shall be a json list
+        for raw_domain, error in (('{"a": 1}', TypeError), ('"a"', TypeError), ('["a", ', ValueError)):
+            json_data["parameters"][0]["domain"] = raw_domain
+            op = Operator(api=api, name="my_op", json_data=json_data)
+            with self.assertRaises(error):
+                _ = op.parameters[0].domain
+        json_data["parameters"][0]["domain"] = '["a", "b"]'
+
+        # Inputs, parameters and outputs descriptions are checked at construction
+        json_data["inputs"][0]["order_index"] = "0"
+        with self.assertRaises(TypeError):
+            Operator(api=api, name="my_op", json_data=json_data)
+
+    def test_catalog_cache_isolation(self):
+        """
+        Operators built from the same cached catalog description don't share their content
+        """
+        # Emulated catalog
+        api = IkatsAPI(emulate=True)
+        api.op.cat_client.db["isolated_op"] = {
+            "id": "13",
+            "name": "isolated_op",
+            "label": "Isolated operator",
+            "description": "Operator description",
+            "family": "Tests",
+            "inputs": [],
+            "parameters": [{"name": "columns", "type": "list", "default_values": ["a"]}],
+            "outputs": [],
+        }
+
+        op_1 = api.op.get(name="isolated_op")
+        op_1.parameters[0].default_value.append("b")
+        op_2 = api.op.get(name="isolated_op")
+        self.assertEqual(["a"], op_2.parameters[0].default_value)
+
+        # cleanup
+        del api.op.cat_client.db["isolated_op"]
+
+    def test_get_many_concurrent_cache(self):
+        """
+        Get several times the same operators at once, with more operators than the cache can hold
+        """
+        # Emulated catalog, answering slowly enough to get overlapping requests
+        names = ["concurrent_op_%s" % i for i in range(5)]
+        loads = []
+
+        class SlowCatalog:
+            """
+            Catalog counting the requests
+            """
+
+            @staticmethod
+            def get_implementation(name):
+                """
+                Get the description of the operator *name*
+                """
+                loads.append(name)
+                time.sleep(0.01)
+                return dict(id="14", name=name, label=name, description="Operator description", family="Tests",
+                            inputs=[], parameters=[], outputs=[])
+
+        # Each operator requested at the same time is got only once from catalog
+        api = IkatsAPI(emulate=True)
+        api.op.cat_client = SlowCatalog()
+        ops = api.op.get_many(names=names * 4)
+        self.assertEqual(names * 4, [x.name for x in ops])
+        self.assertEqual(sorted(names), sorted(loads))
+
+        # Cache smaller than the number of operators
+        cache_size = operator_mgr_.CATALOG_CACHE_SIZE
+        operator_mgr_.CATALOG_CACHE_SIZE = 2
+        try:
+            api = IkatsAPI(emulate=True)
+        finally:
+            operator_mgr_.CATALOG_CACHE_SIZE = cache_size
+        api.op.cat_client = SlowCatalog()
+        for _ in range(10):
+            ops = api.op.get_many(names=names * 4)
+            self.assertEqual(names * 4, [x.name for x in ops])
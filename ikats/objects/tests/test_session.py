@@ -16,11 +16,13 @@ limitations under the License.
 
 """
 
+import time
 from unittest import TestCase
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from ikats.objects.session_ import IkatsSession
+from ikats.objects.session_ import IkatsSession, RETRY_POLICY
 
 
 class TestSession(TestCase):
@@ -43,6 +45,18 @@ class TestSession(TestCase):
         self.assertEqual("%s:%s/tsdb" % (session.host, session.port), session.tsdb_url)
         self.assertEqual(requests.Session, type(session.rs))
 
+        # Connections are pooled and retried on both schemes
+        for scheme in ("http://", "https://"):
+            adapter = session.rs.get_adapter(scheme)
+            self.assertIsInstance(adapter, HTTPAdapter)
+            self.assertIs(RETRY_POLICY, adapter.max_retries)
+
+        # Unreachable backend is not retried
+        start = time.monotonic()
+        with self.assertRaises(requests.ConnectionError):
+            session.rs.get("http://localhost:1")
+        self.assertLess(time.monotonic() - start, 1)
+
         # Nominal session
         host = "http://localhost"
         port = 80
@@ -55,6 +69,16 @@ class TestSession(TestCase):
         self.assertEqual("http://ikats.org", session.host)
         self.assertEqual(80, session.port)
 
+        # URL to backends follow host and port changes
+        self.assertEqual("http://ikats.org:80/datamodel", session.dm_url)
+        session.host = "https://ikats.org"
+        session.port = 8080
+        self.assertEqual("https://ikats.org:8080/datamodel", session.dm_url)
+        self.assertEqual("https://ikats.org:8080/tsdb", session.tsdb_url)
+
+        # Sessions sharing a name share their logger without piling up handlers
+        self.assertEqual(1, len(IkatsSession().log.handlers))
+
     def test_malformed_host(self):
         """
         Test Session non-nominal usages
@@ -74,3 +98,22 @@ class TestSession(TestCase):
         # Bad IP
         with self.assertRaises(ValueError):
             IkatsSession(host="https://1.2.3.4.5")
+
+        # IP with out of range numbers
+        with self.assertRaises(ValueError):
+            IkatsSession(host="http://999.1.1.1")
+
+        # Unsupported scheme
+        with self.assertRaises(ValueError):
+            IkatsSession(host="ftp://ikats.org")
+
+        # Trailing space
+        with self.assertRaises(ValueError):
+            IkatsSession(host="http://ikats.org ")
+
+    def test_valid_host(self):
+        """
+        Hosts accepted by the session
+        """
+        for host in ["http://127.0.0.1", "https://ikats.org/", "http://ikats.org/gui", "http://localhost"]:
+            self.assertEqual(host, IkatsSession(host=host).host)
@@ -22,17 +22,23 @@ from schema import SchemaError
 
 from ikats import IkatsAPI
 from ikats.exceptions import IkatsConflictError, IkatsNotFoundError
+from ikats.objects import Table
 
 
 class TestTable(TestCase):
     """
     Test Table object
     """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = IkatsAPI()
+
     def test_nominal(self):
         """
         Creation of a Table instance
         """
-        api = IkatsAPI()
+        api = self.api
         table = api.table.new()
         name = "my_table"
 
@@ -86,7 +92,7 @@ class TestTable(TestCase):
         """
         Check JSON checker
         """
-        api = IkatsAPI()
+        api = self.api
         table = api.table.new()
         name = "my_table"
 
@@ -104,11 +110,29 @@ class TestTable(TestCase):
         with self.assertRaises(SchemaError):
             table.is_json_valid(data)
 
+    def test_name_not_in_data(self):
+        """
+        Rename a table whose data has a description without name
+        """
+        data = {
+            "table_desc": {
+                "title": "Table Title",
+                "desc": "table description"
+            },
+            "content": {
+                "cells": [[1, 2, 3], [4, 5, 6]]
+            }
+        }
+        table = Table.from_trusted(api=self.api, name="my_table", data=data)
+        table.name = "my_renamed_table"
+        self.assertEqual("my_renamed_table", table.name)
+        self.assertEqual("my_renamed_table", table.data["table_desc"]["name"])
+
     def test_exception(self):
         """
         Tests exception that can be raised
         """
-        api = IkatsAPI()
+        api = self.api
         name = "my_table"
 
         self.assertEqual(0, len(api.table.list()))
@@ -139,3 +163,42 @@ class TestTable(TestCase):
 
         with self.assertRaises(IkatsNotFoundError):
             api.table.get(name="unknown_table")
+
+    def test_extract(self):
+        """
+        Extraction of table content as a dict of dict
+        """
+        api = self.api
+        data = {
+            "headers": {
+                "col": {"data": ["id", "A", "B"]},
+                "row": {"data": [None, "x", "y"]}
+            },
+            "content": {
+                "cells": [[1, 2], [3, 4]]
+            }
+        }
+        table = Table(api=api, data=data)
+
+        self.assertEqual({"x": {"A": 1, "B": 2}, "y": {"A": 3, "B": 4}}, table.extract(obs_id="id", items=["A", "B"]))
+        self.assertEqual({1: {"id": "x"}, 3: {"id": "y"}}, table.extract(obs_id="A", items=["id"]))
+
+        # Key shall be unique
+        data["content"]["cells"] = [[1, 2], [1, 4]]
+        table = Table(api=api, data=data)
+        with self.assertRaises(ValueError):
+            table.extract(obs_id="A", items=["B"])
+
+        # Lines of different lengths
+        data["content"]["cells"] = [[1, 2], [3]]
+        table = Table(api=api, data=data)
+        self.assertEqual({"x": {"A": 1}, "y": {"A": 3}}, table.extract(obs_id="id", items=["A"]))
+
+        # No header column
+        del data["headers"]["row"]
+        data["content"]["cells"] = [[1, 2], [3, 4]]
+        table = Table(api=api, data=data)
+        self.assertEqual({1: {"A": 2}, 3: {"A": 4}}, table.extract(obs_id="id", items=["A"]))
+        data["content"]["cells"] = [[1, 2], [3]]
+        table = Table(api=api, data=data)
+        self.assertEqual({1: {"id": 1}, 3: {"id": 3}}, table.extract(obs_id="id", items=["id"]))
@@ -32,11 +32,33 @@ class TestTimeseries(TestCase):
     """
     ts_to_delete = []
 
+    # FID of the timeseries created by the tests
+    test_fids = ["TEST_TS", "TEST_TS2"]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = IkatsAPI()
+        cls.cleaned = False
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.cleaned:
+            delete_ts_if_exists(fid=cls.test_fids)
+
+    @classmethod
+    def clean_once(cls):
+        """
+        Remove the leftovers of a previous run, once for all the tests using database
+        """
+        if not cls.cleaned:
+            delete_ts_if_exists(fid=cls.test_fids)
+            cls.cleaned = True
+
     def test_new_local(self):
         """
         Creation of a Timeseries instance
         """
-        api = IkatsAPI()
+        api = self.api
 
         # Empty TS
         ts = api.ts.new()
@@ -46,13 +68,54 @@ class TestTimeseries(TestCase):
         self.assertIsNone(ts.fid)
         self.assertEqual(0, len(ts.data))
         self.assertEqual(0, len(ts))
+        self.assertIsNone(ts.start_ts)
+        self.assertIsNone(ts.end_ts)
+
+        # Local points
+        ts.data = [[1000, 1.5], [2000, 2.5], [3000, 3.5]]
+        self.assertEqual(1000, ts.start_ts)
+        self.assertEqual(3000, ts.end_ts)
+
+        # Points are stored as a contiguous float64 array, whatever the provided layout
+        ts.data = np.array([[1000, 2000, 3000], [1.5, 2.5, 3.5]]).T
+        self.assertEqual((3, 2), ts.data.shape)
+        self.assertEqual(np.float64, ts.data.dtype)
+        self.assertTrue(ts.data.flags["C_CONTIGUOUS"])
+        self.assertEqual(2.5, ts.data[1, 1])
+
+        # Points set column-wise
+        ts.data = {"t": np.array([1000, 2000, 3000], dtype=np.int64), "v": [1.5, 2.5, 3.5]}
+        self.assertEqual([[1000, 1.5], [2000, 2.5], [3000, 3.5]], ts.data.tolist())
+        with self.assertRaises(ValueError):
+            ts.data = {"t": [1000, 2000], "v": [1.5]}
+
+        # Columns are available without copy
+        self.assertEqual([1000, 2000, 3000], ts.timestamps.tolist())
+        self.assertEqual([1.5, 2.5, 3.5], ts.values.tolist())
+        self.assertTrue(np.shares_memory(ts.values, ts.data))
+
+        # Adding timeseries merges their points by timestamp
+        ts_2 = api.ts.new(data=[[500, 0.5], [2000, 20.5], [4000, 4.5]])
+        ts_3 = ts + ts_2
+        self.assertEqual([500, 1000, 2000, 2000, 3000, 4000], ts_3.data[:, 0].tolist())
+        self.assertEqual([0.5, 1.5, 2.5, 20.5, 3.5, 4.5], ts_3.data[:, 1].tolist())
+        self.assertEqual(3, len(ts))
+
+    def test_slots(self):
+        """
+        Timeseries don't carry any per-instance dict
+        """
+        ts = self.api.ts.new()
+        self.assertFalse(hasattr(ts, "__dict__"))
+        with self.assertRaises(AttributeError):
+            ts.unknown_attribute = 42
 
     def test_nominal(self):
         """
         Nominal use-case from creation to deletion
         """
-        api = IkatsAPI()
-        delete_ts_if_exists("TEST_TS")
+        api = self.api
+        self.clean_once()
 
         # Create a new TS
         ts = api.ts.new()
@@ -72,8 +135,8 @@ class TestTimeseries(TestCase):
         self.assertIsNotNone(ts.tsuid)
 
         # Minimum Metadata has been computed
-        self.assertEqual(ts.data[0][0], ts.metadata.get("ikats_start_date"))
-        self.assertEqual(ts.data[-1][0], ts.metadata.get("ikats_end_date"))
+        self.assertEqual(ts.start_ts, ts.metadata.get("ikats_start_date"))
+        self.assertEqual(ts.end_ts, ts.metadata.get("ikats_end_date"))
         self.assertEqual(len(ts.data), ts.metadata.get("qual_nb_points"))
 
         # Delete the TS
@@ -90,8 +153,8 @@ class TestTimeseries(TestCase):
         """
         fid = "TEST_TS"
 
-        api = IkatsAPI()
-        delete_ts_if_exists(fid=fid)
+        api = self.api
+        self.clean_once()
 
         ts = api.ts.new(fid=fid)
 
@@ -115,10 +178,7 @@ class TestTimeseries(TestCase):
 
         # Compare written data with read data
         self.assertEqual(len(ts.data), len(ts2.data))
-        self.assertTrue(np.allclose(
-            np.array(ts.data, dtype=np.float64),
-            np.array(ts2.data, dtype=np.float64),
-            atol=1e-2))
+        self.assertTrue(np.allclose(ts.data, ts2.data, atol=1e-2))
 
         # Delete TS using no exception raise
         self.assertTrue(api.ts.delete(ts=ts2, raise_exception=False))
@@ -130,9 +190,8 @@ class TestTimeseries(TestCase):
         fid = "TEST_TS"
         fid2 = "TEST_TS2"
 
-        api = IkatsAPI()
-        self.assertTrue(delete_ts_if_exists(fid=fid))
-        self.assertTrue(delete_ts_if_exists(fid=fid2))
+        api = self.api
+        self.clean_once()
 
         # Save parent TS
         parent_ts = api.ts.new(fid=fid, data=gen_random_ts(sd=1000000000000, ed=1000000010000, period=1000))
@@ -18,43 +18,80 @@ limitations under the License.
 
 import copy
 
+import numpy as np
+
 from ikats.exceptions import IkatsNotFoundError
-from ikats.lib import check_is_fid_valid, check_type
+from ikats.lib import check_is_fid_valid
 from ikats.objects.generic_ import IkatsObject
 from ikats.objects.metadata_ import Metadata
 
+# Types accepted by the setters (checked on each Timeseries creation)
+_DATA_TYPES = (list, np.ndarray)
+_TSUID_TYPES = (str, type(None))
+
+
+def _merge_points(points_1, points_2):
+    """
+    Merge two sets of points sorted by timestamp, keeping the result sorted by timestamp
+    For equal timestamps, points of *points_1* come first
+
+    :param points_1: first points as a (N,2) array
+    :param points_2: second points as a (M,2) array
+
+    :type points_1: np.ndarray
+    :type points_2: np.ndarray
+
+    :returns: the (N+M,2) merged points
+    :rtype: np.ndarray
+    """
+    merged = np.concatenate((points_1, points_2))
+    if len(points_1) and len(points_2) and points_2[0, 0] < points_1[-1, 0]:
+        # Overlapping ranges: the stable sort only has 2 sorted runs to merge
+        merged = merged[np.argsort(merged[:, 0], kind="stable")]
+    return merged
+
 
 class Timeseries(IkatsObject):
     """
     Timeseries class handling a full Timeseries object
     """
 
+    __slots__ = ("__md", "__tsuid", "__fid", "__data", "__flag_data_read")
+
     def __init__(self, api, tsuid=None, fid=None, data=None):
         super().__init__(api)
 
         self.__md = None
         self.__tsuid = None
         self.__fid = None
-        self.__data = []
+        self.__data = np.empty((0, 2), dtype=np.float64)
         self.__flag_data_read = False
 
-        self.metadata = Metadata(api=api, tsuid=tsuid)
         self.tsuid = tsuid
-        self.fid = fid
-        self.data = data
+        if tsuid is not None and fid is not None:
+            # Both identifiers are known (listing, dataset loading...): no need to resolve the tsuid again
+            check_is_fid_valid(fid=fid, raise_exception=True)
+            self.__fid = fid
+        else:
+            self.fid = fid
+        if data is not None:
+            self.data = data
 
     def __len__(self):
-        return len(self.data)
+        return self.data.shape[0]
 
     @property
     def data(self):
         """
         return the data associated to this Timeseries as a numpy array
+        Points are stored as a (N,2) float64 array: 1st column is the timestamp (ms since EPOCH), 2nd is the value
+
+        Points may also be set column-wise as a dict {"t": timestamps, "v": values}
         :rtype: np.array
         """
         if not self.__flag_data_read and self.__tsuid is not None:
             try:
-                self.__data = self.api.ts.fetch(ts=self)
+                self.data = self.api.ts.fetch(ts=self)
             except IkatsNotFoundError:
                 # For fresh created Timeseries, there is no metadata so the `fetch` method can't be performed
                 # since it needs the ikats_start_date and ikats_end_date to work properly
@@ -65,20 +102,77 @@ class Timeseries(IkatsObject):
 
     @data.setter
     def data(self, value):
-        if check_type(value, [list], "data", raise_exception=False):
-            self.__data = value
+        if value is None:
+            # Nothing to set
+            return
+        if isinstance(value, dict):
+            # Columns are written directly into the points array
+            timestamps = np.asarray(value["t"])
+            values = np.asarray(value["v"])
+            if timestamps.shape != values.shape:
+                raise ValueError("Timestamps and values shall have the same length")
+            data = np.empty((len(timestamps), 2), dtype=np.float64)
+            data[:, 0] = timestamps
+            data[:, 1] = values
+            self.__data = data
+        elif isinstance(value, _DATA_TYPES):
+            # Converted once here: a contiguous float64 array is kept as is (no copy)
+            self.__data = np.ascontiguousarray(value, dtype=np.float64).reshape(-1, 2)
+
+    @property
+    def timestamps(self):
+        """
+        Timestamps of the points (ms since EPOCH), as a view on the 1st column of data (no copy)
+        :rtype: np.array
+        """
+        return self.data[:, 0]
+
+    @property
+    def values(self):
+        """
+        Values of the points, as a view on the 2nd column of data (no copy)
+        :rtype: np.array
+        """
+        return self.data[:, 1]
+
+    @property
+    def start_ts(self):
+        """
+        Timestamp of the first point (ms since EPOCH), None if there is no point
+        Points are expected to be sorted by timestamp
+        :rtype: int or None
+        """
+        data = self.data
+        if len(data) == 0:
+            return None
+        return int(data[0, 0])
+
+    @property
+    def end_ts(self):
+        """
+        Timestamp of the last point (ms since EPOCH), None if there is no point
+        Points are expected to be sorted by timestamp
+        :rtype: int or None
+        """
+        data = self.data
+        if len(data) == 0:
+            return None
+        return int(data[-1, 0])
 
     @property
     def metadata(self):
         """
-        Metadata object linked to this timeseries
+        Metadata object linked to this timeseries (created upon first access)
         :rtype: Metadata
         """
+        if self.__md is None:
+            self.__md = Metadata(api=self.api, tsuid=self.__tsuid)
         return self.__md
 
     @metadata.setter
     def metadata(self, value):
-        check_type(value=value, allowed_types=[Metadata], var_name="metadata", raise_exception=True)
+        if not isinstance(value, Metadata):
+            raise TypeError("Type of metadata shall belong to %s, not %s" % ([Metadata], type(value)))
         self.__md = value
 
     @property
@@ -96,11 +190,13 @@ class Timeseries(IkatsObject):
 
         This setter shouldn't be used manually
         """
-        check_type(value=value, allowed_types=[str, None], var_name="tsuid", raise_exception=True)
+        if not isinstance(value, _TSUID_TYPES):
+            raise TypeError("Type of tsuid shall belong to %s, not %s" % ([str, None], type(value)))
         if self.__tsuid != value:
             self.__tsuid = value
-            # Update Metadata link
-            self.metadata.tsuid = value
+            # Update Metadata link (if already created)
+            if self.__md is not None:
+                self.__md.tsuid = value
 
     @property
     def fid(self):
@@ -130,8 +226,14 @@ class Timeseries(IkatsObject):
         return "<LocalTimeseries>"
 
     def __add__(self, other):
-        ts = copy.deepcopy(self)
-        ts.data += other.data
+        # Points are not copied: the merge below builds new ones
+        ts = Timeseries(api=self.api)
+        if self.__md is not None:
+            ts.metadata = copy.deepcopy(self.__md)
+        ts.tsuid = self.tsuid
+        ts.__fid = self.fid
+        ts.data = _merge_points(self.data, other.data)
+        ts.__flag_data_read = True
         if ts.tsuid is None:
             ts.tsuid = other.tsuid
         if ts.fid is None:
@@ -151,6 +253,8 @@ class Timeseries(IkatsObject):
 
         If the timeseries is a new one (object has no tsuid defined), the computation of the metadata is forced
 
+        The local changes of *metadata* are saved along with the generated and inherited ones
+
         Returns a boolean status of the action (True means "OK", False means "errors occurred")
 
         :param parent: (optional) Timeseries object of inheritance parent
@@ -164,11 +268,8 @@ class Timeseries(IkatsObject):
         :returns: the status of the action
         :rtype: bool
         """
-        result = self.api.ts.save(ts=self, generate_metadata=generate_metadata, parent=parent,
-                                  raise_exception=raise_exception)
-        if parent is not None:
-            self.metadata.fetch()
-        return result and self.metadata.save()
+        return self.api.ts.save(ts=self, generate_metadata=generate_metadata, parent=parent,
+                                raise_exception=raise_exception)
 
     def delete(self, raise_exception=True):
         """
@@ -208,4 +309,4 @@ class Timeseries(IkatsObject):
         :raises TypeError: if *ed* is not an int
         :raises IkatsNotFoundError: if TS data points couldn't be retrieved properly
         """
-        self.__data = self.api.ts.fetch(ts=self, sd=sd, ed=ed)
+        self.data = self.api.ts.fetch(ts=self, sd=sd, ed=ed)
@@ -16,22 +16,36 @@ limitations under the License.
 
 """
 
+from functools import lru_cache
+
 from ikats import IkatsAPI
-from ikats.exceptions import IkatsNotFoundError
+
+
+@lru_cache(maxsize=1)
+def get_api():
+    """
+    API shared by the test helpers (built upon first use)
+
+    :rtype: IkatsAPI
+    """
+    return IkatsAPI()
+
 
 def delete_ts_if_exists(fid):
     """
-    Delete a TS if it exists
-    Nothing is return
+    Delete TS if they exist
     Useful to prepare environments
 
-    :param fid: FID of the TS to delete
-    :type fid: str
+    All the TS are found with a single request to database
+
+    :param fid: FID (or list of FID) of the TS to delete
+    :type fid: str or list of str
+
+    :returns: True if all existing TS were deleted
+    :rtype: bool
     """
-    api = IkatsAPI()
+    api = get_api()
 
-    try:
-        ts = api.ts.get(fid=fid)
-        return api.ts.delete(ts=ts, raise_exception=False)
-    except IkatsNotFoundError:
-        return True
+    fids = [fid] if isinstance(fid, str) else fid
+    found = api.ts.fid2tsuid_many(fids=fids, raise_exception=False)
+    return all([api.ts.delete(ts=tsuid, raise_exception=False) for tsuid in found.values()])
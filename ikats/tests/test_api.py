@@ -28,12 +28,17 @@ class TestApi(TestCase):
     """
     Main API tests
     """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = IkatsAPI(host="http://localhost", port=80, emulate=False)
+
     def test_ds(self):
         """
         Tests main operations on Datasets
         """
         # DS list
-        api = IkatsAPI(host="http://localhost", port=80, emulate=False)
+        api = self.api
         ds_list = api.ds.list()
         self.assertLess(0, len(ds_list))
 
@@ -42,9 +47,12 @@ class TestApi(TestCase):
         Tests main operations on Timeseries
         """
         # TS list
-        api = IkatsAPI(host="http://localhost", port=80, emulate=False)
+        api = self.api
         ts_list = api.ts.list()
         self.assertLess(0, len(ts_list))
+        ts_ref = next(api.ts.iter_list())
+        self.assertEqual(ts_list[0].tsuid, ts_ref.tsuid)
+        self.assertEqual(ts_list[0].fid, ts_ref.fid)
 
         with self.assertRaises(ValueError):
             api.ts.get(fid="fid_set", tsuid="tsuid_set")
@@ -59,12 +67,19 @@ class TestApi(TestCase):
         new_fid = api.ts.tsuid2fid(tsuid=ts.tsuid)
         self.assertEqual(my_fid, new_fid)
 
+        # Batched converters
+        self.assertEqual({my_fid: my_tsuid}, api.ts.fid2tsuid_many(fids=[my_fid]))
+        self.assertEqual({my_tsuid: my_fid}, api.ts.tsuid2fid_many(tsuids=[my_tsuid]))
+        self.assertEqual({my_fid: my_tsuid}, api.ts.fid2tsuid_many(fids=[my_fid, "UNKNOWN_FID"], raise_exception=False))
+        with self.assertRaises(IkatsNotFoundError):
+            api.ts.fid2tsuid_many(fids=[my_fid, "UNKNOWN_FID"])
+
     def test_op(self):
         """
         Tests main operations on Operators
         """
         # OP list
-        api = IkatsAPI(host="http://localhost", port=80, emulate=False)
+        api = self.api
         op_list = api.op.list()
         self.assertLess(0, len(op_list))
 
@@ -79,7 +94,7 @@ class TestApi(TestCase):
         """
         Tests main operations on Tables
         """
-        api = IkatsAPI(host="http://localhost", port=80, emulate=False)
+        api = self.api
 
         tables_list = api.table.list()
         self.assertEqual(0, len(tables_list))
@@ -18,8 +18,9 @@ limitations under the License.
 
 from unittest import TestCase
 
-from ikats.lib import (check_is_fid_valid, check_is_valid_ds_name,
-                       check_is_valid_epoch, check_type)
+from ikats.lib import (CountedCache, check_is_fid_valid,
+                       check_is_valid_ds_name, check_is_valid_epoch,
+                       check_type, typed_attrs)
 
 
 class TestUtils(TestCase):
@@ -136,3 +137,83 @@ class TestUtils(TestCase):
         # Valid FID
         fid_value = "azerty"
         self.assertTrue(check_is_fid_valid(fid=fid_value, raise_exception=False))
+
+    def test_counted_cache(self):
+        """
+        Test CountedCache entries expiration
+        """
+        loads = []
+
+        def loader():
+            """
+            Count the loads
+            """
+            loads.append(1)
+            return len(loads)
+
+        cache = CountedCache(reads=2)
+
+        # First get loads the value, then it is read twice from cache before being loaded again
+        self.assertEqual(1, cache.get("key", loader))
+        self.assertEqual(1, cache.get("key", loader))
+        self.assertEqual(1, cache.get("key", loader))
+        self.assertEqual(2, cache.get("key", loader))
+        self.assertEqual(1, len(cache))
+
+        # Invalidation
+        cache.get("other", loader)
+        cache.invalidate(match=lambda key: key == "key")
+        self.assertEqual(1, len(cache))
+        self.assertEqual(4, cache.get("key", loader))
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+
+        # Oldest entries are dropped first
+        cache = CountedCache(reads=2, maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.get(key, loader)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(8, cache.get("a", loader))
+
+    def test_typed_attrs(self):
+        """
+        Test typed_attrs class decorator
+        """
+
+        @typed_attrs({"name": [str, None], "items": list})
+        class Dummy:
+            """
+            Class with typed properties
+            """
+
+            def __init__(self):
+                self._name = None
+                self._items = []
+
+            @property
+            def name(self):
+                """
+                Name
+                """
+                return self._name
+
+            @property
+            def items(self):
+                """
+                Items
+                """
+                return self._items
+
+        obj = Dummy()
+        obj.name = "text"
+        obj.items = [1]
+        self.assertEqual("text", obj.name)
+        self.assertEqual([1], obj.items)
+        obj.name = None
+        self.assertIsNone(obj.name)
+
+        with self.assertRaises(TypeError):
+            obj.name = 42
+        with self.assertRaises(TypeError):
+            obj.items = None
+        self.assertEqual([1], obj.items)
@@ -14,6 +14,7 @@ setup(name='ikats',
       packages=find_packages(),
       setup_requires=['nose>=1.3.7', 'coverage'],
       install_requires=["numpy>=1.15.4", 'requests>=2.21.0', 'schema>=0.6.8'],
+      extras_require={'fast': ['orjson']},
       keywords='timeseries, big data, spark',
       license='Apache License 2.0',
       test_suite='nose.collector',